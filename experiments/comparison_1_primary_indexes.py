@@ -15,6 +15,7 @@ from indexes.core.database_manager import DatabaseManager
 from sql_parser.parser import parse
 from sql_parser.executor import Executor
 from experiments.csv_exporter import export_comparison_1
+from experiments.runner import run_configs, print_summary
 import time
 
 def test_primary_index(index_type, index_name):
@@ -66,10 +67,10 @@ def test_primary_index(index_type, index_name):
     INTO cities
     """
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     plans = parse(load_sql)
     load_result = executor.execute(plans[0])
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
 
     # Get metrics from result
     # Extract number of inserted records from summary message
@@ -85,7 +86,7 @@ def test_primary_index(index_type, index_name):
         'total_reads': load_result.disk_reads,
         'total_writes': load_result.disk_writes,
         'time_ms': load_result.execution_time_ms,
-        'total_time_ms': (end_time - start_time) * 1000
+        'total_time_ms': (end_time - start_time) / 1e6
     }
 
     print(f"  Summary: {load_result.data}")
@@ -178,46 +179,33 @@ def main():
     print("Using SQL Parser & Executor")
     print("="*70)
 
-    # Test each index type
-    all_results = []
-
-    # Sequential
-    seq_results = test_primary_index("SEQUENTIAL", "Sequential")
-    all_results.append(seq_results)
-
-    # ISAM
-    isam_results = test_primary_index("ISAM", "ISAM")
-    all_results.append(isam_results)
-
-    # B+Tree
-    btree_results = test_primary_index("BTREE", "B+Tree Clustered")
-    all_results.append(btree_results)
-
-    # Print comparison summary
-    print("\n" + "="*70)
-    print("SUMMARY: COMPARISON ACROSS ALL PRIMARY INDEXES")
-    print("="*70)
+    # Test each index type: Sequential, ISAM, B+Tree
+    configs = [
+        (("SEQUENTIAL", "Sequential"), {}),
+        (("ISAM", "ISAM"), {}),
+        (("BTREE", "B+Tree Clustered"), {}),
+    ]
 
-    print("\n--- INSERTION PERFORMANCE ---")
-    print(f"  {'Index Type':<20} {'Records':<12} {'Total R/W':<20} {'Time (ms)'}")
-    print(f"  {'-'*75}")
-    for res in all_results:
-        ins = res['insert']
-        rw = f"{ins['total_reads']}/{ins['total_writes']}"
-        print(f"  {res['index_type']:<20} {ins['records']:<12} {rw:<20} {ins['total_time_ms']:.2f}")
-
-    print("\n--- SEARCH PERFORMANCE (Exact Search by ID) ---")
-    print(f"  {'Index Type':<20} {'Avg Reads':<15} {'Avg Time (ms)':<15} {'Avg Results'}")
-    print(f"  {'-'*65}")
-    for res in all_results:
-        print(f"  {res['index_type']:<20} {res['search']['avg_reads']:<15.2f} {res['search']['avg_time_ms']:<15.2f} {res['search']['avg_results']:.1f}")
-
-    print("\n--- RANGE SEARCH PERFORMANCE (by ID range) ---")
-    print(f"  {'Index Type':<20} {'Avg Reads':<15} {'Avg Time (ms)':<15} {'Avg Results'}")
-    print(f"  {'-'*65}")
-    for res in all_results:
-        rs = res['range_search']
-        print(f"  {res['index_type']:<20} {rs['avg_reads']:<15.2f} {rs['avg_time_ms']:<15.2f} {rs['avg_results']:.0f}")
+    all_results = run_configs(test_primary_index, configs)
+
+    print_summary("SUMMARY: COMPARISON ACROSS ALL PRIMARY INDEXES", [
+        ("INSERTION PERFORMANCE",
+         [("Index Type", 20), ("Records", 12), ("Total R/W", 20), ("Time (ms)", None)],
+         [(res['index_type'], res['insert']['records'],
+           f"{res['insert']['total_reads']}/{res['insert']['total_writes']}",
+           f"{res['insert']['total_time_ms']:.2f}") for res in all_results],
+         75),
+        ("SEARCH PERFORMANCE (Exact Search by ID)",
+         [("Index Type", 20), ("Avg Reads", 15), ("Avg Time (ms)", 15), ("Avg Results", None)],
+         [(res['index_type'], f"{res['search']['avg_reads']:.2f}", f"{res['search']['avg_time_ms']:.2f}",
+           f"{res['search']['avg_results']:.1f}") for res in all_results],
+         65),
+        ("RANGE SEARCH PERFORMANCE (by ID range)",
+         [("Index Type", 20), ("Avg Reads", 15), ("Avg Time (ms)", 15), ("Avg Results", None)],
+         [(res['index_type'], f"{res['range_search']['avg_reads']:.2f}", f"{res['range_search']['avg_time_ms']:.2f}",
+           f"{res['range_search']['avg_results']:.0f}") for res in all_results],
+         65),
+    ])
 
     # Export results to CSV
     print("\n--- EXPORTING RESULTS TO CSV ---")
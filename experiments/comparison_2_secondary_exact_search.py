@@ -17,6 +17,7 @@ from indexes.core.database_manager import DatabaseManager
 from sql_parser.parser import parse
 from sql_parser.executor import Executor
 from experiments.csv_exporter import export_comparison_2
+from experiments.runner import run_configs, print_summary
 import time
 import json
 
@@ -65,17 +66,17 @@ def test_secondary_index(config_name, secondary_index_type=None):
     INTO cities
     """
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     plans = parse(load_sql)
     load_result = executor.execute(plans[0])
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
 
     insert_metrics = {
         'records': load_result.data,
         'total_reads': load_result.disk_reads,
         'total_writes': load_result.disk_writes,
         'time_ms': load_result.execution_time_ms,
-        'total_time_ms': (end_time - start_time) * 1000
+        'total_time_ms': (end_time - start_time) / 1e6
     }
 
     print(f"  Loaded: {load_result.data} records")
@@ -89,14 +90,14 @@ def test_secondary_index(config_name, secondary_index_type=None):
         CREATE INDEX ON cities(city) USING {secondary_index_type}
         """
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         plans = parse(create_index_sql)
         index_result = executor.execute(plans[0])
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
 
         insert_metrics['index_creation_reads'] = index_result.disk_reads
         insert_metrics['index_creation_writes'] = index_result.disk_writes
-        insert_metrics['index_creation_time_ms'] = (end_time - start_time) * 1000
+        insert_metrics['index_creation_time_ms'] = (end_time - start_time) / 1e6
 
         print(f"  Index created")
         print(f"  R/W: {index_result.disk_reads}/{index_result.disk_writes}")
@@ -168,41 +169,27 @@ def main():
     print("Using SQL Parser & Executor")
     print("="*70)
 
-    all_results = []
-
-    # Configuration 1: No secondary index
-    result_no_index = test_secondary_index("No Secondary Index", secondary_index_type=None)
-    all_results.append(result_no_index)
-
-    # Configuration 2: Hash secondary index
-    result_hash = test_secondary_index("Hash Secondary Index", secondary_index_type="HASH")
-    all_results.append(result_hash)
-
-    # Configuration 3: B+Tree Unclustered secondary index
-    result_btree = test_secondary_index("B+Tree Unclustered Secondary Index", secondary_index_type="BTREE")
-    all_results.append(result_btree)
-
-
-
-    # Print comparison summary
-    print("\n" + "="*70)
-    print("SUMMARY: COMPARISON OF SECONDARY INDEXES FOR EXACT SEARCH")
-    print("="*70)
-
-    print("\n--- INSERTION OVERHEAD (Data Load + Index Creation) ---")
-    print(f"  {'Configuration':<35} {'Total R/W':<20} {'Total Time (ms)'}")
-    print(f"  {'-'*75}")
-    for res in all_results:
-        ins = res['insert']
-        rw = f"{ins['total_insertion_reads']}/{ins['total_insertion_writes']}"
-        print(f"  {res['config']:<35} {rw:<20} {ins['total_insertion_time_ms']:.2f}")
-
-    print("\n--- EXACT SEARCH PERFORMANCE (by city field) ---")
-    print(f"  {'Configuration':<35} {'Avg Reads':<15} {'Avg Time (ms)':<15} {'Avg Results'}")
-    print(f"  {'-'*80}")
-    for res in all_results:
-        srch = res['search']
-        print(f"  {res['config']:<35} {srch['avg_reads']:<15.2f} {srch['avg_time_ms']:<15.2f} {srch['avg_results']:.1f}")
+    # Configurations: no secondary index, Hash secondary index, B+Tree Unclustered secondary index
+    configs = [
+        (("No Secondary Index",), {"secondary_index_type": None}),
+        (("Hash Secondary Index",), {"secondary_index_type": "HASH"}),
+        (("B+Tree Unclustered Secondary Index",), {"secondary_index_type": "BTREE"}),
+    ]
+
+    all_results = run_configs(test_secondary_index, configs)
+
+    print_summary("SUMMARY: COMPARISON OF SECONDARY INDEXES FOR EXACT SEARCH", [
+        ("INSERTION OVERHEAD (Data Load + Index Creation)",
+         [("Configuration", 35), ("Total R/W", 20), ("Total Time (ms)", None)],
+         [(res['config'], f"{res['insert']['total_insertion_reads']}/{res['insert']['total_insertion_writes']}",
+           f"{res['insert']['total_insertion_time_ms']:.2f}") for res in all_results],
+         75),
+        ("EXACT SEARCH PERFORMANCE (by city field)",
+         [("Configuration", 35), ("Avg Reads", 15), ("Avg Time (ms)", 15), ("Avg Results", None)],
+         [(res['config'], f"{res['search']['avg_reads']:.2f}", f"{res['search']['avg_time_ms']:.2f}",
+           f"{res['search']['avg_results']:.1f}") for res in all_results],
+         80),
+    ])
 
     # Analysis
     print("\n--- ANALYSIS ---")
@@ -0,0 +1,30 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def run_configs(test_fn, configs):
+    """Run test_fn(*args, **kwargs) for each (args, kwargs) in configs, in order"""
+    # --parallel: each configuration uses its own database directory, so they can run
+    # in separate processes. Disk R/W counts are unaffected; timings include contention.
+    if "--parallel" in sys.argv:
+        with ProcessPoolExecutor(max_workers=len(configs)) as pool:
+            futures = [pool.submit(test_fn, *args, **kwargs) for args, kwargs in configs]
+            return [f.result() for f in futures]
+    return [test_fn(*args, **kwargs) for args, kwargs in configs]
+
+
+def print_summary(title, sections):
+    """Print the summary banner and one table per (heading, columns, rows, rule_width) section"""
+    # columns: (label, width) pairs, the last one with width None (not padded).
+    # The whole summary is built first and written with a single print.
+    lines = ["\n" + "="*70, title, "="*70]
+    for heading, columns, rows, rule_width in sections:
+        lines.append(f"\n--- {heading} ---")
+        lines.append(_table_row([label for label, _ in columns], columns))
+        lines.append(f"  {'-'*rule_width}")
+        lines.extend(_table_row(row, columns) for row in rows)
+    print("\n".join(lines))
+
+
+def _table_row(cells, columns):
+    return "  " + " ".join(f"{cell:<{width}}" if width else f"{cell}" for cell, (_, width) in zip(cells, columns))
@@ -1,9 +1,10 @@
 import os
 import sys
 import json
+import dataclasses
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import streamlit as st
 import pandas as pd
@@ -13,7 +14,7 @@ _ROOT = Path(__file__).resolve().parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-from sql_parser.parser import parse
+from sql_parser.parser import parse, warm_up
 from sql_parser.executor import Executor
 from indexes.core.database_manager import DatabaseManager
 
@@ -853,6 +854,8 @@ def main():
     )
     
     load_custom_css()
+    # parser listo antes de la primera consulta (se construye una vez por proceso)
+    warm_up()
     
     # Header principal
     col1, col2 = st.columns([3, 1])
@@ -1187,7 +1190,14 @@ WHERE ubicacion NEAREST ((40.758, -73.9855), 10);"""
                     
                     if plan_obj:
                         st.markdown("**📋 Plan de Ejecución:**")
-                        attrs = {k: v for k, v in vars(plan_obj).items() if not k.startswith("_")}
+                        # los planes usan slots: no hay __dict__, se recorren los campos declarados;
+                        # column_mappings es de solo lectura (mappingproxy) y st.json necesita un dict
+                        attrs = {
+                            f.name: getattr(plan_obj, f.name)
+                            for f in dataclasses.fields(plan_obj)
+                            if not f.name.startswith("_")
+                        }
+                        attrs = {k: dict(v) if isinstance(v, Mapping) else v for k, v in attrs.items()}
                         plan_info = {"tipo": type(plan_obj).__name__, **attrs}
                         st.json(plan_info, expanded=True)
                         
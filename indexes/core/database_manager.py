@@ -187,6 +187,63 @@ class DatabaseManager:
 
         return OperationResult(primary_result.data, total_time, total_reads, total_writes, primary_result.rebuild_triggered, breakdown)
 
+    def bulk_insert(self, table_name: str, records):
+        # Inserta un lote; data = cantidad insertada. Igual que insert() en el primario,
+        # una clave que ya existe o que se repite en el lote lanza ValueError, y en ese
+        # caso no se inserta ningún registro. Si el índice primario tiene bulk_insert y
+        # no hay secundarios, el lote completo se delega en él (verifica y escribe de una vez)
+        if table_name not in self.tables:
+            raise ValueError(f"Table {table_name} does not exist")
+
+        table_info = self.tables[table_name]
+        primary_index = table_info["primary_index"]
+        records = list(records)
+
+        if not table_info["secondary_indexes"] and hasattr(primary_index, "bulk_insert"):
+            result = primary_index.bulk_insert(records)
+            breakdown = {
+                "primary_metrics": {"reads": result.disk_reads, "writes": result.disk_writes, "time_ms": result.execution_time_ms}
+            }
+            return OperationResult(len(result.data), result.execution_time_ms, result.disk_reads, result.disk_writes, result.rebuild_triggered, breakdown)
+
+        keys = [record.get_key() for record in records]
+        seen = set()
+        for key in keys:
+            if key in seen:
+                raise ValueError(f"Key {key} repeated in batch")
+            seen.add(key)
+
+        check = self.search_many(table_name, keys)
+        existing = [key for key, found in zip(keys, check.data) if found is not None]
+        if existing:
+            raise ValueError(f"Primary keys {existing} already exist")
+
+        inserted = 0
+        total_reads = check.disk_reads
+        total_writes = check.disk_writes
+        total_time = check.execution_time_ms
+        rebuild_triggered = False
+        breakdown = {
+            "primary_metrics": {"reads": check.disk_reads, "writes": check.disk_writes, "time_ms": check.execution_time_ms}
+        }
+
+        for record in records:
+            result = self.insert(table_name, record)
+            if result.data:
+                inserted += 1
+            total_reads += result.disk_reads
+            total_writes += result.disk_writes
+            total_time += result.execution_time_ms
+            rebuild_triggered = rebuild_triggered or result.rebuild_triggered
+
+            for key, metrics in result.operation_breakdown.items():
+                acc = breakdown.setdefault(key, {"reads": 0, "writes": 0, "time_ms": 0.0})
+                acc["reads"] += metrics["reads"]
+                acc["writes"] += metrics["writes"]
+                acc["time_ms"] += metrics["time_ms"]
+
+        return OperationResult(inserted, total_time, total_reads, total_writes, rebuild_triggered, breakdown)
+
     def search(self, table_name: str, value, field_name: str = None):
         if table_name not in self.tables:
             raise ValueError(f"Table {table_name} does not exist")
@@ -276,6 +333,32 @@ class DatabaseManager:
 
             return OperationResult(matching_records, scan_result.execution_time_ms, scan_result.disk_reads, scan_result.disk_writes)
 
+    def search_many(self, table_name: str, keys):
+        # Búsqueda por clave primaria de varias claves; data = lista alineada con keys
+        # (None si no existe). Si el índice primario tiene search_batch lo usa en una sola operación
+        if table_name not in self.tables:
+            raise ValueError(f"Table {table_name} does not exist")
+
+        primary_index = self.tables[table_name]["primary_index"]
+        keys = list(keys)
+
+        if hasattr(primary_index, "search_batch"):
+            result = primary_index.search_batch(keys)
+            hits = result.data
+            return OperationResult([hits.get(key) for key in keys], result.execution_time_ms, result.disk_reads, result.disk_writes)
+
+        records = []
+        total_reads = total_writes = 0
+        total_time = 0.0
+        for key in keys:
+            result = primary_index.search(key)
+            records.append(result.data or None)
+            total_reads += result.disk_reads
+            total_writes += result.disk_writes
+            total_time += result.execution_time_ms
+
+        return OperationResult(records, total_time, total_reads, total_writes)
+
     def range_search(self, table_name: str, start_key, end_key, field_name: str = None, spatial_type: str = None):
         if table_name not in self.tables:
             raise ValueError(f"Table {table_name} does not exist")
@@ -798,10 +881,7 @@ class DatabaseManager:
         return self.INDEX_TYPES.get(index_type, {}).get("secondary", False)
 
     def _get_field_info(self, table: Table, field_name: str):
-        for fname, ftype, fsize in table.all_fields:
-            if fname == field_name:
-                return (ftype, fsize)
-        return None
+        return table.field_info.get(field_name)
 
     def _create_primary_index(self, table: Table, index_type: str, csv_filename: str):
         if index_type == "ISAM":
@@ -1,6 +1,10 @@
 import time
 
 class OperationResult:
+    # operation_breakdown siempre existe ({} si no hay desglose): basta con "if result.operation_breakdown"
+    __slots__ = ("data", "execution_time_ms", "disk_reads", "disk_writes", "total_disk_accesses",
+                 "rebuild_triggered", "operation_breakdown")
+
     def __init__(self, data, execution_time_ms, disk_reads, disk_writes, rebuild_triggered=False, operation_breakdown=None):
         self.data = data
         self.execution_time_ms = execution_time_ms
@@ -39,16 +43,17 @@ class PerformanceTracker:
             self.writes = 0
             self.rebuild_occurred = False
 
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
 
-    def track_read(self):
-        self.reads += 1
+    def track_read(self, count: int = 1):
+        self.reads += count
 
-    def track_write(self):
-        self.writes += 1
+    def track_write(self, count: int = 1):
+        self.writes += count
 
     def end_operation(self, result_data, rebuild_triggered=False):
-        execution_time = (time.time() - self.start_time) * 1000
+        # perf_counter_ns: monotónico y entero; se pasa a ms solo al reportar
+        execution_time = (time.perf_counter_ns() - self.start_time) / 1e6
 
         if rebuild_triggered:
             self.rebuild_occurred = True
@@ -1,4 +1,6 @@
+import keyword
 import struct
+from functools import cached_property, lru_cache
 from typing import List, Tuple, Dict
 
 class Table:
@@ -16,30 +18,177 @@ class Table:
         self.record = Record(all_fields, key_field)
         self.record_size = self.record.RECORD_SIZE
 
+    @cached_property
+    def record_struct(self) -> struct.Struct:
+        # formato del registro compilado una sola vez por tabla
+        return self.record._struct
+
+    @cached_property
+    def field_info(self) -> Dict[str, Tuple[str, int]]:
+        # nombre -> (tipo, tamaño), armado una vez por tabla
+        return {name: (field_type, field_size) for name, field_type, field_size in self.all_fields}
+
+    def pack_many(self, records) -> bytearray:
+        """Empaqueta los registros contiguos en un solo buffer preasignado (pack_into por offset)"""
+        record_struct = self.record_struct
+        buf = bytearray(len(records) * self.record_size)
+        offset = 0
+        for record in records:
+            record.pack_into(buf, offset, record_struct)
+            offset += self.record_size
+        return buf
+
+    def unpack_many(self, data) -> List["Record"]:
+        """Inverso de pack_many: un Record por cada registro completo de data"""
+        records = []
+        for values in self.record_struct.iter_unpack(memoryview(data)[:len(data) - len(data) % self.record_size]):
+            record = Record.__new__(Record, self.all_fields)
+            record.key_field = self.key_field
+            record._assign_unpacked(values)
+            records.append(record)
+        return records
+
+@lru_cache(maxsize=None)
+def _compile_format(fmt: str) -> struct.Struct:
+    # un Struct por formato, compartido por todos los Record del mismo esquema
+    return struct.Struct(fmt)
+
+@lru_cache(maxsize=256)
+def _layout(fields: Tuple[Tuple[str, str, int], ...]) -> Tuple[str, int]:
+    # formato y tamaño por esquema: cada Record nuevo no rearma el string de formato
+    fmt = "".join(Record._field_code(field_type, field_size) for _, field_type, field_size in fields)
+    return fmt, _compile_format(fmt).size
+
+def field_struct(list_of_types: List[Tuple[str, str, int]], field_name: str) -> Tuple[int, struct.Struct]:
+    """Offset en bytes y Struct de un campo dentro del registro empaquetado (mismo layout nativo que Record)"""
+    prefix = ""
+    for name, field_type, field_size in list_of_types:
+        code = Record._field_code(field_type, field_size)
+        if name == field_name:
+            # calcsize incluye el padding de alineación previo al campo
+            offset = struct.calcsize(prefix + code) - struct.calcsize(code)
+            return offset, struct.Struct(code)
+        prefix += code
+    raise KeyError(f"Campo {field_name} no existe")
+
+
+def _specialized_methods(fields: Tuple[Tuple[str, str, int], ...]) -> dict:
+    """Genera pack/pack_into/_assign_unpacked sin bucles para un esquema (mismo resultado que los genéricos de Record)"""
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name, _, _ in fields):
+        return {}
+
+    pack_lines = []
+    args = []
+    unpack_lines = ["def _assign_unpacked(self, d):"]
+    data_index = 0
+    for i, (name, field_type, field_size) in enumerate(fields):
+        v = f"v{i}"
+        pack_lines.append(f"    {v} = self.{name}")
+        if field_type == "CHAR":
+            # bytes va directo: el código "Ns" de struct ya trunca y rellena con \x00
+            pack_lines.append(f"    if not isinstance({v}, bytes):")
+            pack_lines.append(f"        {v} = str({v}).ljust({field_size}).encode('utf-8')[:{field_size}]")
+        elif field_type == "INT":
+            pack_lines.append(f"    {v} = int({v})")
+        elif field_type == "FLOAT":
+            pack_lines.append(f"    {v} = float({v})")
+        elif field_type == "BOOL":
+            pack_lines.append(f"    {v} = bool({v})")
+        elif field_type == "ARRAY":
+            pack_lines.append(f"    if len({v}) != {field_size}:")
+            pack_lines.append(f"        raise ValueError('Array debe tener {field_size} dimensiones')")
+        if field_type == "ARRAY":
+            args.append(f"*{v}")
+            unpack_lines.append(f"    self.{name} = list(d[{data_index}:{data_index + field_size}])")
+            data_index += field_size
+        else:
+            args.append(v)
+            unpack_lines.append(f"    self.{name} = d[{data_index}]")
+            data_index += 1
+    body = "\n".join(pack_lines)
+    values = ", ".join(args)
+
+    source = "\n".join([
+        "def pack(self, record_struct=None):", body,
+        f"    return (record_struct or self._struct).pack({values})",
+        "",
+        "def pack_into(self, buffer, offset, record_struct=None):", body,
+        f"    (record_struct or self._struct).pack_into(buffer, offset, {values})",
+        "",
+        *unpack_lines,
+    ])
+    namespace = {}
+    exec(source, namespace)
+    return {name: namespace[name] for name in ("pack", "pack_into", "_assign_unpacked")}
+
+@lru_cache(maxsize=256)
+def _record_class(base: type, fields: Tuple[Tuple[str, str, int], ...]) -> type:
+    # subclase por esquema: los campos son __slots__ (sin __dict__ por registro) y
+    # formato/tamaño/esquema quedan como atributos de clase compartidos
+    names = tuple(name for name, _, _ in fields)
+    # cada campo es un slot en el mismo namespace que los métodos y atributos de Record:
+    # un campo llamado pack, FORMAT, from_fields, ... los taparía, así que se rechaza
+    reserved = set(dir(base)) | {"_schema_base", "_field_names", "FORMAT", "RECORD_SIZE", "_struct", "value_type_size"}
+    invalid = [name for name in names if name in reserved or not name.isidentifier() or name.startswith("__")]
+    if invalid:
+        raise ValueError(f"Nombres de campo reservados o inválidos: {invalid}")
+    fmt, size = _layout(fields)
+    return type(base.__name__, (base,), {
+        "__slots__": names,
+        "__module__": __name__,
+        "_schema_base": base,
+        "_field_names": names,
+        "FORMAT": fmt,
+        "RECORD_SIZE": size,
+        "_struct": _compile_format(fmt),
+        "value_type_size": list(fields),
+        **_specialized_methods(fields),
+    })
+
+def _restore_record(list_of_types, key_field, values):
+    return Record.from_fields(list_of_types, key_field, [name for name, _, _ in list_of_types], values)
+
+
 class Record:
+    __slots__ = ("key_field",)
+
+    def __new__(cls, list_of_types: List[Tuple[str, str, int]], key_field: str = None):
+        base = getattr(cls, "_schema_base", cls)
+        try:
+            schema_cls = _record_class(base, tuple(list_of_types))
+        except TypeError:
+            # campos dados como listas (no hasheables)
+            schema_cls = _record_class(base, tuple(map(tuple, list_of_types)))
+        return object.__new__(schema_cls)
+
+    def __reduce__(self):
+        # las clases por esquema se crean en runtime: se serializa el esquema y los valores
+        values = [getattr(self, name) for name in self._field_names]
+        return (_restore_record, (self.value_type_size, self.key_field, values))
+
     def __init__(self, list_of_types: List[Tuple[str, str, int]], key_field: str):
-        self.FORMAT = self._make_format(list_of_types)
-        self.RECORD_SIZE = struct.calcsize(self.FORMAT)
-        self.value_type_size = [(element[0], element[1], element[2]) for element in list_of_types]
+        # FORMAT, RECORD_SIZE y value_type_size los aporta la clase del esquema (ver __new__)
         self.key_field = key_field
 
-        for field_name, _, _ in self.value_type_size:
+        for field_name in self._field_names:
             setattr(self, field_name, None)
 
+    @staticmethod
+    def _field_code(field_type: str, field_size: int) -> str:
+        if field_type == "INT":
+            return "i"
+        elif field_type == "FLOAT":
+            return "f"
+        elif field_type == "CHAR":
+            return f"{field_size}s"
+        elif field_type == "ARRAY":
+            return f"{field_size}f"
+        elif field_type == "BOOL":
+            return "?"
+        return ""
+
     def _make_format(self, list_of_types):
-        format_str = ""
-        for _, field_type, field_size in list_of_types:
-            if field_type == "INT":
-                format_str += "i"
-            elif field_type == "FLOAT":
-                format_str += "f"
-            elif field_type == "CHAR":
-                format_str += f"{field_size}s"
-            elif field_type == "ARRAY":
-                format_str += f"{field_size}f"
-            elif field_type == "BOOL":
-                format_str += "?"
-        return format_str
+        return _layout(tuple(map(tuple, list_of_types)))[0]
 
     def set_values(self, **kwargs):
         """Método flexible para asignar valores a cualquier campo"""
@@ -48,7 +197,15 @@ class Record:
                 setattr(self, field_name, value)
             else:
                 raise AttributeError(f"Campo {field_name} no existe en el registro")
-    def pack(self) -> bytes:
+    def pack(self, record_struct: struct.Struct = None) -> bytes:
+        """record_struct: Struct ya compilado del esquema (p.ej. Table.record_struct) para no reparsear FORMAT"""
+        return (record_struct or self._struct).pack(*self._processed_values())
+
+    def pack_into(self, buffer, offset: int, record_struct: struct.Struct = None):
+        """Como pack, pero escribe directo en buffer[offset:]"""
+        (record_struct or self._struct).pack_into(buffer, offset, *self._processed_values())
+
+    def _processed_values(self) -> list:
         processed_values = []
         for field_name, field_type, field_size in self.value_type_size:
             value = getattr(self, field_name)
@@ -58,13 +215,13 @@ class Record:
                 processed_values.extend(value)
             else:
                 processed_values.append(self._process_value(value, field_type, field_size))
-
-        return struct.pack(self.FORMAT, *processed_values)
+        return processed_values
 
     def _process_value(self, value, field_type: str, field_size: int):
         if field_type == "CHAR":
             if isinstance(value, bytes):
-                return value[:field_size].ljust(field_size, b'\x00')
+                # struct ("Ns") trunca y rellena con \x00 al empaquetar
+                return value
             else:
                 return str(value).ljust(field_size).encode('utf-8')[:field_size]
         elif field_type == "INT":
@@ -93,21 +250,39 @@ class Record:
             raise AttributeError(f"Campo {field_name} no existe")
 
     @classmethod
-    def unpack(cls, data: bytes, list_of_types: List[Tuple[str, str, int]], key_field: str):
+    def from_fields(cls, list_of_types: List[Tuple[str, str, int]], key_field: str, names: Tuple[str, ...], values):
+        """Construye un registro asignando valores por posición; names debe venir validado contra list_of_types"""
         record = cls(list_of_types, key_field)
-        unpacked_data = struct.unpack(record.FORMAT, data)
+        for field_name, value in zip(names, values):
+            setattr(record, field_name, value)
+        return record
 
+    @classmethod
+    def unpack(cls, data: bytes, list_of_types: List[Tuple[str, str, int]], key_field: str):
+        # _assign_unpacked escribe todos los campos: se omite el __init__ que los deja en None
+        record = cls.__new__(cls, list_of_types)
+        record.key_field = key_field
+        record._assign_unpacked(record._struct.unpack(data))
+        return record
+
+    @classmethod
+    def unpack_cached(cls, record_struct: struct.Struct, data, list_of_types: List[Tuple[str, str, int]], key_field: str, offset: int = 0):
+        """Como unpack, con el Struct del esquema ya compilado; lee directo desde data[offset:] sin copiar"""
+        record = cls.__new__(cls, list_of_types)
+        record.key_field = key_field
+        record._assign_unpacked(record_struct.unpack_from(data, offset))
+        return record
+
+    def _assign_unpacked(self, unpacked_data):
         data_index = 0
-        for field_name, field_type, field_size in record.value_type_size:
+        for field_name, field_type, field_size in self.value_type_size:
             if field_type == "ARRAY":
                 array_values = unpacked_data[data_index:data_index + field_size]
-                setattr(record, field_name, list(array_values))
+                setattr(self, field_name, list(array_values))
                 data_index += field_size
             else:
-                setattr(record, field_name, unpacked_data[data_index])
+                setattr(self, field_name, unpacked_data[data_index])
                 data_index += 1
-
-        return record
     
     def __str__(self):
         fields = []
@@ -137,6 +312,16 @@ class Record:
 
 
 class IndexRecord(Record):
+    __slots__ = ()
+
+    def __new__(cls, index_field_type: str, index_field_size: int):
+        fields = (("index_value", index_field_type, index_field_size), ("primary_key", "INT", 4))
+        return object.__new__(_record_class(getattr(cls, "_schema_base", cls), fields))
+
+    def __reduce__(self):
+        field_type, field_size = self.value_type_size[0][1], self.value_type_size[0][2]
+        return (_restore_index_record, (field_type, field_size, self.index_value, self.primary_key))
+
     def __init__(self, index_field_type: str, index_field_size: int):
         list_of_types = [
             ("index_value", index_field_type, index_field_size),
@@ -152,20 +337,13 @@ class IndexRecord(Record):
     def unpack(cls, data: bytes, list_of_types: List[Tuple[str, str, int]], key_field: str):
         index_field_type = list_of_types[0][1]
         index_field_size = list_of_types[0][2]
-        record = cls(index_field_type, index_field_size)
-        unpacked_data = struct.unpack(record.FORMAT, data)
-
-        data_index = 0
-        for field_name, field_type, field_size in record.value_type_size:
-            if field_type == "ARRAY":
-                array_values = unpacked_data[data_index:data_index + field_size]
-                setattr(record, field_name, list(array_values))
-                data_index += field_size
-            else:
-                setattr(record, field_name, unpacked_data[data_index])
-                data_index += 1
-
+        record = cls.__new__(cls, index_field_type, index_field_size)
+        record.key_field = "index_value"
+        record._assign_unpacked(record._struct.unpack(data))
         return record
 
 
-
+def _restore_index_record(index_field_type, index_field_size, index_value, primary_key):
+    record = IndexRecord(index_field_type, index_field_size)
+    record.set_index_data(index_value, primary_key)
+    return record
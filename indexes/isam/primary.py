@@ -339,8 +339,12 @@ class ISAMPrimaryIndex:
         self.next_root_index_page_number = 0
         self.next_leaf_index_page_number = 0
         self.performance = PerformanceTracker()
+        # solo esta clase crea/borra el archivo de datos: se sigue su existencia
+        # en memoria en vez de un stat() por operación
+        self._has_data = os.path.exists(self.filename)
 
     def _create_initial_files(self, record: Record):
+        self._has_data = True
         with open(self.filename, "wb") as file:
             self.performance.track_write()
             file.write(struct.pack(self.HEADER_FORMAT, 0))
@@ -385,6 +389,18 @@ class ISAMPrimaryIndex:
         self.performance.track_read()
         return Page.unpack(file.read(page_size), self.block_factor, self.record_template.RECORD_SIZE, self.table)
 
+    def _read_page_if_present(self, file, page_num):
+        # Igual que _read_page, pero devuelve None si la página no está completa
+        # en el archivo (fin de archivo) en vez de dejar que falle el unpack
+        page_size = Page.HEADER_SIZE + self.block_factor * self.record_template.RECORD_SIZE
+        offset = self.DATA_START_OFFSET + (page_num * page_size)
+        file.seek(offset)
+        self.performance.track_read()
+        data = file.read(page_size)
+        if len(data) < page_size:
+            return None
+        return Page.unpack(data, self.block_factor, self.record_template.RECORD_SIZE, self.table)
+
     def _write_page(self, file, page_num, page):
         page_size = Page.HEADER_SIZE + self.block_factor * self.record_template.RECORD_SIZE
         offset = self.DATA_START_OFFSET + (page_num * page_size)
@@ -621,16 +637,15 @@ class ISAMPrimaryIndex:
 
         while current_page_num != -1 and current_page_num not in visited:
             visited.add(current_page_num)
-            try:
-                page = self._read_page(file, current_page_num)
+            page = self._read_page_if_present(file, current_page_num)
+            if page is None:
+                break
 
-                for record in page.records:
-                    if record.get_key() == key_value:
-                        return record
+            for record in page.records:
+                if record.get_key() == key_value:
+                    return record
 
-                current_page_num = page.next_page if page.next_page != -1 else -1
-            except:
-                break
+            current_page_num = page.next_page
 
         return None
 
@@ -750,17 +765,16 @@ class ISAMPrimaryIndex:
         length = 1
         current = page.next_page
         while current != -1 and length < 10:
-            try:
-                next_page = self._read_page(file, current)
-                current = next_page.next_page
-                length += 1
-            except:
+            next_page = self._read_page_if_present(file, current)
+            if next_page is None:
                 break
+            current = next_page.next_page
+            length += 1
 
         return length
     def warm_up(self):
         
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             return
         
         try:
@@ -783,7 +797,7 @@ class ISAMPrimaryIndex:
         self.performance = PerformanceTracker()
 
     def _should_rebuild(self):
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             return False
 
         free_count = self._get_free_count()
@@ -831,7 +845,7 @@ class ISAMPrimaryIndex:
         if existing_record_result.data is not None:
             raise ValueError(f"Primary key {record.get_key()} already exists")
 
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             self._create_initial_files(record)
             return self.performance.end_operation(True, False)
 
@@ -857,7 +871,7 @@ class ISAMPrimaryIndex:
     def search(self, key_value):
         self.performance.start_operation()
 
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             return self.performance.end_operation(None, False)
 
         with open(self.root_index_file, "rb") as root_file, \
@@ -877,7 +891,7 @@ class ISAMPrimaryIndex:
     def delete(self, key_value):
         self.performance.start_operation()
 
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             return self.performance.end_operation(False)
 
         target_leaf_page_num = self._find_target_leaf_page(key_value)
@@ -907,7 +921,7 @@ class ISAMPrimaryIndex:
 
         results = []
 
-        if not os.path.exists(self.filename) or begin_key > end_key:
+        if not self._has_data or begin_key > end_key:
             return self.performance.end_operation(results)
 
         start_leaf, end_leaf = self._find_leaf_page_range_for_keys(begin_key, end_key)
@@ -951,6 +965,7 @@ class ISAMPrimaryIndex:
         for old, backup in zip(old_files, backup_files):
             if os.path.exists(old):
                 os.rename(old, backup)
+        self._has_data = False
 
         new_root_factor = int(self.root_index_block_factor * 1.5)
         new_leaf_factor = int(self.leaf_index_block_factor * 1.5)
@@ -1041,7 +1056,7 @@ class ISAMPrimaryIndex:
 
         results = []
 
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             return self.performance.end_operation(results)
 
         with open(self.filename, "rb") as file:
@@ -1068,7 +1083,7 @@ class ISAMPrimaryIndex:
 
     def show_data_structure(self):
         print("\n--- DATA PAGES ---")
-        if not os.path.exists(self.filename):
+        if not self._has_data:
             print("  (no existe)")
             return
 
@@ -1106,6 +1121,7 @@ class ISAMPrimaryIndex:
                     current_page_num = page.next_page if page.next_page != -1 else None
 
     def drop_table(self):
+        self._has_data = False
         files_to_remove = [
             self.filename,
             self.root_index_file,
@@ -1,7 +1,9 @@
 import os
 import math
+import mmap
+import struct
 from typing import List, Optional, Any
-from ..core.record import Record, Table
+from ..core.record import Record, Table, field_struct
 from ..core.performance_tracker import PerformanceTracker
 
 class SequentialFile:
@@ -12,6 +14,16 @@ class SequentialFile:
         self.list_of_types = table.all_fields
         self.key_field = table.key_field
         self.record_size = table.record_size
+        # offset de la clave dentro del registro: los recorridos comparan solo la
+        # clave y deserializan el registro completo únicamente cuando hace falta
+        self._key_offset, self._key_struct = field_struct(self.list_of_types, self.key_field)
+        # Struct que por cada registro salta todo menos la clave: iter_unpack extrae
+        # las claves de un buffer completo en C ('=' tamaños estándar, sin alineación)
+        key_tail = self.record_size - self._key_offset - self._key_struct.size
+        self._key_scan = struct.Struct(f"={self._key_offset}x{self._key_struct.format}{key_tail}x")
+        # Struct del registro compilado una vez por tabla
+        self._struct = table.record_struct
+        self._main_fh = None
         self.k = k_rec if k_rec is not None else 10
         self.deleted_count = 0
         self.total_records = 0
@@ -39,6 +51,34 @@ class SequentialFile:
         return file_size // self.record_size
 
 
+    def _main_reader(self):
+        # handle de lectura del main que se mantiene abierto entre búsquedas; sin
+        # buffer para que siempre vea lo que escriben delete()/rebuild() por otro handle
+        if self._main_fh is None or self._main_fh.closed:
+            self._main_fh = open(self.main_file, 'rb', buffering=0)
+        return self._main_fh
+
+    def close(self):
+        if self._main_fh is not None:
+            self._main_fh.close()
+            self._main_fh = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _unpack(self, buf, offset: int = 0) -> Record:
+        return Record.unpack_cached(self._struct, buf, self.list_of_types, self.key_field, offset)
+
+    def _scan_keys(self, buf) -> list:
+        usable = len(buf) - len(buf) % self.record_size
+        return [k for (k,) in self._key_scan.iter_unpack(memoryview(buf)[:usable])]
+
+    def _read_key(self, buf, offset: int = 0):
+        return self._key_struct.unpack_from(buf, offset + self._key_offset)[0]
+
     def rebuild(self):
         self.performance.start_operation()
 
@@ -49,10 +89,12 @@ class SequentialFile:
         if os.path.exists(self.aux_file):
             os.remove(self.aux_file)
 
+        self.close()
+        # se empaqueta todo y se escribe de una vez en vez de un write por registro
+        buf = self.table.pack_many(records)
+        self.performance.track_write(len(records))
         with open(self.main_file, 'wb') as f:
-            for record in records:
-                self.performance.track_write()
-                f.write(record.pack())
+            f.write(buf)
 
         open(self.aux_file, 'wb').close()
 
@@ -71,7 +113,7 @@ class SequentialFile:
 
         record.active = True
         with open(self.aux_file, 'ab') as f:
-            f.write(record.pack())
+            f.write(record.pack(self._struct))
             self.performance.track_write()
 
         self.total_records += 1
@@ -85,6 +127,43 @@ class SequentialFile:
 
 
 
+    def bulk_insert(self, records: List[Record]):
+        # Igual que insert() pero con un solo open/write al aux para todo el lote
+        # y como mucho un rebuild al final. Todas las claves se verifican con un solo
+        # search_batch antes de escribir: si alguna ya existe (o se repite dentro del
+        # lote) se lanza ValueError, como insert(), sin insertar nada
+        self.performance.start_operation()
+
+        records = list(records)
+        keys = [record.get_key() for record in records]
+        seen = set()
+        for key in keys:
+            if key in seen:
+                self.performance.end_operation(None)
+                raise ValueError(f"Clave {key} repetida en el lote")
+            seen.add(key)
+
+        existing = self.search_batch(keys).data
+        if existing:
+            self.performance.end_operation(None)
+            raise ValueError(f"Records con claves {sorted(existing)} ya existen")
+
+        for record in records:
+            record.active = True
+
+        if records:
+            self.performance.track_write(len(records))
+            with open(self.aux_file, 'ab') as f:
+                f.write(self.table.pack_many(records))
+
+        self.total_records += len(records)
+
+        rebuild_triggered = self.get_file_size(self.aux_file) > self.k
+        if rebuild_triggered:
+            self.rebuild()
+
+        return self.performance.end_operation(records, rebuild_triggered)
+
     def delete(self, key: Any):
         self.performance.start_operation()
 
@@ -102,14 +181,14 @@ class SequentialFile:
                     if not data:
                         break
 
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
-                    rec_key = rec.get_key()
+                    rec_key = self._read_key(data)
 
                     if rec_key == key:
+                        rec = self._unpack(data)
                         if rec.active:
                             rec.active = False
                             f.seek(mid * self.record_size)
-                            f.write(rec.pack())
+                            f.write(rec.pack(self._struct))
                             self.performance.track_write()
                             self.deleted_count += 1
 
@@ -129,28 +208,33 @@ class SequentialFile:
 
         if os.path.exists(self.aux_file):
             with open(self.aux_file, 'r+b') as f:
-                i = 0
-                while data := f.read(self.record_size):
-                    self.performance.track_read()
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
-                    if rec.get_key() == key:
-                        if rec.active:
-                            rec.active = False
-                            f.seek(i * self.record_size)
-                            f.write(rec.pack())
-                            self.performance.track_write()
-                            self.deleted_count += 1
+                # el aux es pequeño (<= k registros): se lee de una vez
+                buf = f.read()
+                keys = self._scan_keys(buf)
+                try:
+                    i = keys.index(key)
+                except ValueError:
+                    i = -1
+                self.performance.track_read(i + 1 if i >= 0 else len(keys))
+                if i >= 0:
+                    off = i * self.record_size
+                    rec = self._unpack(buf, off)
+                    if rec.active:
+                        rec.active = False
+                        f.seek(off)
+                        f.write(rec.pack(self._struct))
+                        self.performance.track_write()
+                        self.deleted_count += 1
 
-                            rebuild_triggered = self.total_records > 0 and self.deleted_count > (self.total_records * 0.1)
-                            f.close()
+                        rebuild_triggered = self.total_records > 0 and self.deleted_count > (self.total_records * 0.1)
+                        f.close()
 
-                            if rebuild_triggered:
-                                self.rebuild()
+                        if rebuild_triggered:
+                            self.rebuild()
 
-                            return self.performance.end_operation(True, rebuild_triggered)
-                        else:
-                            return self.performance.end_operation(False)
-                    i += 1
+                        return self.performance.end_operation(True, rebuild_triggered)
+                    else:
+                        return self.performance.end_operation(False)
 
         return self.performance.end_operation(False)
 
@@ -159,49 +243,94 @@ class SequentialFile:
 
         main_size = self.get_file_size(self.main_file)
         if main_size > 0:
-            with open(self.main_file, 'rb') as f:
-                left, right = 0, main_size - 1
+            f = self._main_reader()
+            left, right = 0, main_size - 1
 
-                while left <= right:
-                    mid = (left + right) // 2
-                    f.seek(mid * self.record_size)
-                    data = f.read(self.record_size)
-                    self.performance.track_read()
+            while left <= right:
+                mid = (left + right) // 2
+                f.seek(mid * self.record_size)
+                data = f.read(self.record_size)
+                self.performance.track_read()
 
-                    if not data:
-                        break
+                if not data:
+                    break
 
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
-                    rec_key = rec.get_key()
+                rec_key = self._read_key(data)
 
-                    if rec_key == key:
-                        if rec.active:
-                            return self.performance.end_operation(rec)
-                        else:
-                            return self.performance.end_operation(None)
-                    elif rec_key < key:
-                        left = mid + 1
+                if rec_key == key:
+                    rec = self._unpack(data)
+                    if rec.active:
+                        return self.performance.end_operation(rec)
                     else:
-                        right = mid - 1
+                        return self.performance.end_operation(None)
+                elif rec_key < key:
+                    left = mid + 1
+                else:
+                    right = mid - 1
 
         if os.path.exists(self.aux_file):
             with open(self.aux_file, 'rb') as f:
-                while True:
-                    data = f.read(self.record_size)
-                    if not data:
-                        break
+                buf = f.read()
+            keys = self._scan_keys(buf)
+            try:
+                i = keys.index(key)
+            except ValueError:
+                i = -1
+            self.performance.track_read(i + 1 if i >= 0 else len(keys))
+            if i >= 0:
+                rec = self._unpack(buf, i * self.record_size)
+                if rec.active:
+                    return self.performance.end_operation(rec)
+                else:
+                    return self.performance.end_operation(None)
 
-                    self.performance.track_read()
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
+        return self.performance.end_operation(None)
 
-                    if rec.get_key() == key:
-                        if rec.active:
-                            return self.performance.end_operation(rec)
+
+    def search_batch(self, keys):
+        # Busca varias claves con un solo open/mmap del main y una sola pasada
+        # por el aux; data = {clave: Record} solo con las claves activas encontradas
+        self.performance.start_operation()
+
+        hits = {}
+        pending = set(keys)
+        rs = self.record_size
+        main_size = self.get_file_size(self.main_file)
+
+        if main_size > 0 and pending:
+            with open(self.main_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for key in list(pending):
+                    left, right = 0, main_size - 1
+                    while left <= right:
+                        mid = (left + right) // 2
+                        self.performance.track_read()
+                        rec_key = self._read_key(mm, mid * rs)
+                        if rec_key == key:
+                            rec = self._unpack(mm, mid * rs)
+                            if rec.active:
+                                hits[key] = rec
+                            # la clave está en el main (activa o borrada): no se busca en el aux
+                            pending.discard(key)
+                            break
+                        elif rec_key < key:
+                            left = mid + 1
                         else:
-                            return self.performance.end_operation(None)
+                            right = mid - 1
 
-        return self.performance.end_operation(None)
+        if pending and os.path.exists(self.aux_file):
+            with open(self.aux_file, 'rb') as f:
+                buf = f.read()
+            for i, rec_key in enumerate(self._scan_keys(buf)):
+                self.performance.track_read()
+                if rec_key in pending:
+                    rec = self._unpack(buf, i * rs)
+                    if rec.active:
+                        hits[rec_key] = rec
+                    pending.discard(rec_key)
+                    if not pending:
+                        break
 
+        return self.performance.end_operation(hits)
 
     def range_search(self, begin_key, end_key):
         self.performance.start_operation()
@@ -210,41 +339,39 @@ class SequentialFile:
         main_size = self.get_file_size(self.main_file)
 
         if main_size > 0:
-            start_pos = 0
-            with open(self.main_file, 'rb') as f:
+            rs = self.record_size
+            with open(self.main_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start_pos = 0
                 left, right = 0, main_size - 1
                 while left <= right:
                     mid = (left + right) // 2
-                    f.seek(mid * self.record_size)
-                    data = f.read(self.record_size)
-                    if data:
-                        self.performance.track_read()
-                        rec = Record.unpack(data, self.list_of_types, self.key_field)
-                        if rec.get_key() >= begin_key:
-                            start_pos = mid
-                            right = mid - 1
-                        else:
-                            left = mid + 1
+                    self.performance.track_read()
+                    if self._read_key(mm, mid * rs) >= begin_key:
+                        start_pos = mid
+                        right = mid - 1
+                    else:
+                        left = mid + 1
 
-            with open(self.main_file, 'rb') as f:
-                f.seek(start_pos * self.record_size)
-                for i in range(start_pos, main_size):
-                    data = f.read(self.record_size)
-                    if not data:
-                        break
+                # solo se deserializan los registros cuya clave cae en el rango
+                for off in range(start_pos * rs, main_size * rs, rs):
                     self.performance.track_read()
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
-                    if rec.active and begin_key <= rec.get_key() <= end_key:
-                        results.append(rec)
-                    elif rec.get_key() > end_key:
+                    rec_key = self._read_key(mm, off)
+                    if begin_key <= rec_key <= end_key:
+                        rec = self._unpack(mm, off)
+                        if rec.active:
+                            results.append(rec)
+                    elif rec_key > end_key:
                         break
 
         if os.path.exists(self.aux_file):
             with open(self.aux_file, 'rb') as f:
-                while data := f.read(self.record_size):
-                    self.performance.track_read()
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
-                    if rec.active and begin_key <= rec.get_key() <= end_key:
+                buf = f.read()
+            keys = self._scan_keys(buf)
+            self.performance.track_read(len(keys))
+            for i, rec_key in enumerate(keys):
+                if begin_key <= rec_key <= end_key:
+                    rec = self._unpack(buf, i * self.record_size)
+                    if rec.active:
                         results.append(rec)
 
         results.sort(key=lambda r: r.get_key())
@@ -258,7 +385,7 @@ class SequentialFile:
         with open(self.main_file, 'rb') as f:
             while data := f.read(self.record_size):
                 self.performance.track_read()
-                rec = Record.unpack(data, self.list_of_types, self.key_field)
+                rec = self._unpack(data)
                 if rec.active:
                     records.append(rec)
 
@@ -266,13 +393,14 @@ class SequentialFile:
             with open(self.aux_file, 'rb') as f:
                 while data := f.read(self.record_size):
                     self.performance.track_read()
-                    rec = Record.unpack(data, self.list_of_types, self.key_field)
+                    rec = self._unpack(data)
                     if rec.active:
                         records.append(rec)
 
         return self.performance.end_operation(records)
 
     def drop_table(self):
+        self.close()
         removed_files = []
         if os.path.exists(self.main_file):
             os.remove(self.main_file)
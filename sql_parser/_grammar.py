@@ -0,0 +1,10 @@
+from importlib import resources
+
+
+def load_grammar() -> str:
+    # se lee como recurso del paquete (funciona también desde zip/wheel)
+    return resources.files(__package__).joinpath("grammar.lark").read_text(encoding="utf-8")
+
+
+# una sola lectura por proceso: el módulo se importa una vez y lo comparten los parsers
+GRAMMAR = load_grammar()
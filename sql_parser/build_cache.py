@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# Precompila las tablas LALR de grammar.lark en el archivo de cache que usa
+# parser.py, para que los procesos solo tengan que cargarlas al arrancar.
+#
+#   python -m sql_parser.build_cache
+import os
+import sys
+
+from .parser import _build_parser, _cache_path
+
+
+def main() -> int:
+    path = _cache_path()
+    # Lark solo escribe el cache si no existe: se borra para regenerarlo siempre
+    if os.path.exists(path):
+        os.remove(path)
+    _build_parser()
+    if not os.path.exists(path):
+        print(f"No se pudo escribir el cache del parser en {path}", file=sys.stderr)
+        return 1
+    print(f"Cache del parser generado: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,13 @@
 import csv
+import io
+import itertools
+import mmap
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, closing
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 from .plan_types import (
     CreateTablePlan, LoadDataPlan, SelectPlan, InsertPlan, DeletePlan,
@@ -9,6 +18,80 @@ from indexes.core.record import Table, Record
 from indexes.core.performance_tracker import OperationResult
 from indexes.core.database_manager import DatabaseManager
 
+# Tamaño mínimo de archivo para leer el CSV vía mmap en vez de línea a línea
+_MMAP_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _cast_csv_row(row_values: List[str], field_plan: Tuple[Tuple[str, str, int, Any], ...]) -> Optional[List[Any]]:
+    # devuelve los valores ya casteados en el orden de field_plan, o None si algún campo falla
+    n_values = len(row_values)
+    values: List[Any] = []
+    try:
+        for field_name, field_type, field_size, col_idx in field_plan:
+            if field_type == "ARRAY":
+                if col_idx is None:
+                    values.append(tuple([0.0] * field_size))
+                    continue
+
+                array_values = []
+                for csv_idx in col_idx:
+                    if 0 <= csv_idx < n_values:
+                        try:
+                            array_values.append(Executor._cast_value(row_values[csv_idx], "FLOAT"))
+                        except ValueError:
+                            array_values.append(0.0)
+                    else:
+                        array_values.append(0.0)
+
+                while len(array_values) < field_size:
+                    array_values.append(0.0)
+                values.append(tuple(array_values[:field_size]))
+            else:
+                raw = row_values[col_idx] if 0 <= col_idx < n_values else None
+
+                if field_type == "CHAR" and field_name == "fecha":
+                    raw = Executor._cast_date_ddmmyyyy_to_iso(str(raw) if raw is not None else "")
+
+                values.append(Executor._cast_value(raw, field_type))
+    except Exception:
+        return None
+    return values
+
+
+@lru_cache(maxsize=128)
+def _csv_field_plan(table: str, phys_fields: Tuple[Tuple[str, str, int], ...], header: Tuple[str, ...],
+                    column_mappings: Optional[Tuple[Tuple[str, Tuple[str, ...]], ...]]) -> Tuple[Tuple[str, str, int, Any], ...]:
+    # (campo, tipo, tamaño, posición en el CSV) por cada campo físico que viene del archivo;
+    # se cachea por (tabla, esquema, header, mapeos) para cargas repetidas del mismo formato
+    header_pos: Dict[str, int] = {}
+    for i, h in enumerate(header):
+        header_pos.setdefault(h, i)
+    mappings = dict(column_mappings) if column_mappings else {}
+
+    field_plan = []
+    for field_name, field_type, field_size in phys_fields:
+        # Excluir campos internos (active, etc) que no vienen del CSV
+        if field_name == 'active':
+            continue
+        if field_type == "ARRAY":
+            if field_name in mappings:
+                col_idx = tuple(header_pos.get(c, -1) for c in mappings[field_name])
+            else:
+                col_idx = None
+        else:
+            col_idx = header_pos.get(field_name, -1)
+        field_plan.append((field_name, field_type, field_size, col_idx))
+    return tuple(field_plan)
+
+
+def _parse_csv_chunk(filepath: str, start: int, end: int, delimiter: str,
+                     field_plan: Tuple[Tuple[str, str, int, Any], ...]) -> List[Optional[List[Any]]]:
+    # worker de LOAD DATA paralelo: parsea y castea el rango [start, end) del archivo
+    with open(filepath, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+    return [_cast_csv_row(row_values, field_plan) for row_values in reader]
+
 
 class Executor:
     def __init__(self, db_manager: DatabaseManager):
@@ -125,7 +208,8 @@ class Executor:
         return OperationResult(result_msg, 0, 0, 0)  # CREATE TABLE doesn't involve significant disk I/O in our model
 
     # ====== helpers CSV ======
-    def _defaults_for_field(self, ftype: str) -> Any:
+    @staticmethod
+    def _defaults_for_field(ftype: str) -> Any:
         if ftype == "INT":
             return 0
         if ftype == "FLOAT":
@@ -138,12 +222,13 @@ class Executor:
             return (0.0, 0.0) 
         return None
 
-    def _cast_value(self, raw: str, ftype: str):
+    @staticmethod
+    def _cast_value(raw: str, ftype: str):
         if raw is None:
             return None
         raw = str(raw).strip()
         if raw == "":
-            return self._defaults_for_field(ftype)
+            return Executor._defaults_for_field(ftype)
         if ftype == "INT":
             return int(raw)
         if ftype == "FLOAT":
@@ -154,7 +239,8 @@ class Executor:
             return raw.lower() in ("1", "true", "t", "yes", "y", "si", "sí")
         return raw
 
-    def _cast_date_ddmmyyyy_to_iso(self, s: str) -> str:
+    @staticmethod
+    def _cast_date_ddmmyyyy_to_iso(s: str) -> str:
         # convierte "24/10/2024" -> "2024-10-24"; si ya está en "YYYY-MM-DD" lo deja
         s = (s or "").strip()
         if not s:
@@ -175,31 +261,58 @@ class Executor:
         # simple heurística ; o ,  (prioriza ';' si aparece)
         return ";" if header_line.count(";") >= header_line.count(",") else ","
 
-    def _spanish_header_mapping(self, headers: List[str]) -> Dict[str, str]:
-        mapping: Dict[str, str] = {}
-        for h in headers:
-            hl = (h or "").strip().lower()
-            # id
-            if ("id" in hl) and ("venta" in hl or "id" == hl or hl.startswith("id ")):
-                mapping[hl] = "id"
-                continue
-            # nombre
-            if "nombre" in hl:
-                mapping[hl] = "nombre"
-                continue
-            # cantidad
-            if "cantidad" in hl:
-                mapping[hl] = "cantidad"
-                continue
-            # precio
-            if "precio" in hl:
-                mapping[hl] = "precio"
-                continue
-            # fecha
-            if "fecha" in hl:
-                mapping[hl] = "fecha"
-                continue
-        return mapping
+    def _iter_csv_lines(self, filepath: str):
+        # archivos grandes: mmap + bytes.find para cortar líneas sin copiar por lectura
+        size = os.path.getsize(filepath)
+        if sys.platform == "win32" or size < _MMAP_MIN_BYTES:
+            with open(filepath, "r", encoding="utf-8", newline="") as f:
+                yield from f
+            return
+
+        with open(filepath, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            find = mm.find
+            pos = 0
+            while pos < size:
+                nl = find(b"\n", pos)
+                end = size if nl == -1 else nl + 1
+                yield mm[pos:end].decode("utf-8")
+                pos = end
+
+    @staticmethod
+    def _csv_record_end(mm, start: int, pos: int, size: int) -> int:
+        # primer fin de línea desde pos que no cae dentro de un campo entre comillas:
+        # solo se corta en un '\n' precedido por un número par de '"' desde start
+        # (las comillas escapadas "" no cambian la paridad)
+        quotes = 0
+        scanned = start
+        while True:
+            nl = mm.find(b"\n", pos)
+            if nl == -1:
+                return size
+            quotes += mm[scanned:nl].count(b'"')
+            scanned = nl
+            if quotes % 2 == 0:
+                return nl + 1
+            pos = nl + 1
+
+    def _csv_chunk_bounds(self, filepath: str, n_chunks: int) -> List[Tuple[int, int]]:
+        # divide el cuerpo del CSV (sin header) en rangos alineados a fin de registro
+        size = os.path.getsize(filepath)
+        bounds: List[Tuple[int, int]] = []
+        with open(filepath, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = self._csv_record_end(mm, 0, 0, size)
+            step = max(1, (size - start) // n_chunks)
+            while start < size:
+                end = start + step
+                if end >= size:
+                    end = size
+                else:
+                    end = self._csv_record_end(mm, start, end - 1, size)
+                bounds.append((start, end))
+                start = end
+        return bounds
 
     # ====== LOAD DATA FROM FILE ======
     def _load_data(self, plan: LoadDataPlan):
@@ -215,76 +328,52 @@ class Executor:
         total_reads = total_writes = 0
         total_time_ms = 0.0
 
-        with open(plan.filepath, "r", encoding="utf-8", newline="") as fh_probe:
-            first_line = fh_probe.readline()
-            delimiter = self._guess_delimiter(first_line)
+        lines = self._iter_csv_lines(plan.filepath)
+        first_line = next(lines, "")
+        delimiter = self._guess_delimiter(first_line)
 
-        with open(plan.filepath, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f, delimiter=delimiter)
+        with closing(lines), ExitStack() as stack:
+            reader = csv.reader(itertools.chain([first_line], lines), delimiter=delimiter)
             header = next(reader, None)
             if not header:
                 return OperationResult("CSV vacío: insertados=0", 0, 0, 0)
 
-            # Excluir campos internos (active, etc) que no vienen del CSV
-            user_fields = [(name, ftype, fsize) for (name, ftype, fsize) in phys_fields
-                          if name not in ['active']]
-
-            for row_values in reader:
-                rec = Record(phys_fields, key_field)
-                ok_row = True
+            has_active = any(name == 'active' for (name, _, _) in phys_fields)
+            mappings_key = None
+            if plan.column_mappings:
+                mappings_key = tuple((k, tuple(v)) for k, v in plan.column_mappings.items())
+            field_plan = _csv_field_plan(plan.table, tuple(phys_fields), tuple(header), mappings_key)
+            # nombres resueltos una vez: cada fila se asigna por posición sin validar campo a campo
+            plan_names = tuple(name for (name, _, _, _) in field_plan)
+
+            # archivos grandes: el parseo/cast se reparte por chunks entre procesos;
+            # las inserciones siguen siendo secuenciales y en el orden del archivo
+            workers = os.cpu_count() or 1
+            bounds = []
+            if workers > 1 and sys.platform != "win32" and os.path.getsize(plan.filepath) >= _MMAP_MIN_BYTES:
+                bounds = self._csv_chunk_bounds(plan.filepath, workers)
+
+            if len(bounds) > 1:
+                lines.close()
+                # spawn: la GUI (Streamlit) corre varios hilos y hacer fork de un proceso con hilos puede
+                # quedar bloqueado en locks ajenos; los workers solo necesitan funciones a nivel de módulo
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(workers, len(bounds)),
+                                                               mp_context=multiprocessing.get_context("spawn")))
+                futures = [pool.submit(_parse_csv_chunk, plan.filepath, start, end, delimiter, field_plan)
+                           for start, end in bounds]
+                rows = itertools.chain.from_iterable(f.result() for f in futures)
+            else:
+                rows = (_cast_csv_row(row_values, field_plan) for row_values in reader)
 
-                for field_name, field_type, field_size in user_fields:
-                    try:
-                        if field_type == "ARRAY" and plan.column_mappings and field_name in plan.column_mappings:
-                            csv_column_names = plan.column_mappings[field_name]
-                            array_values = []
-                            
-                            for csv_col in csv_column_names:
-                                try:
-                                    csv_idx = header.index(csv_col)
-                                    if csv_idx < len(row_values):
-                                        val = self._cast_value(row_values[csv_idx], "FLOAT")
-                                        array_values.append(val)
-                                    else:
-                                        array_values.append(0.0)
-                                except (ValueError, IndexError):
-                                    array_values.append(0.0)
-                            
-                            while len(array_values) < field_size:
-                                array_values.append(0.0)
-                            array_values = array_values[:field_size]
-                            
-                            rec.set_field_value(field_name, tuple(array_values))
-                            
-                        elif field_type != "ARRAY":
-                            try:
-                                csv_idx = header.index(field_name)
-                                if csv_idx < len(row_values):
-                                    raw = row_values[csv_idx]
-                                else:
-                                    raw = None
-                            except ValueError:
-                                raw = None
-
-                            if field_type == "CHAR" and field_name == "fecha":
-                                raw = self._cast_date_ddmmyyyy_to_iso(str(raw) if raw is not None else "")
-
-                            val = self._cast_value(raw, field_type)
-                            rec.set_field_value(field_name, val)
-                        else:
-                            rec.set_field_value(field_name, tuple([0.0] * field_size))
-                            
-                    except Exception as e:
-                        ok_row = False
-                        break
-
-                if 'active' in [name for (name, _, _) in phys_fields]:
-                    rec.set_field_value('active', True)
-
-                if not ok_row:
+            for values in rows:
+                if values is None:
                     cast_err += 1
                     continue
 
+                rec = Record.from_fields(phys_fields, key_field, plan_names, values)
+                if has_active:
+                    rec.active = True
+
                 try:
                     res = self.db.insert(plan.table, rec)
                     total_reads += res.disk_reads
@@ -412,9 +501,12 @@ class Executor:
         else:
             for (name, ftype, _) in phys_fields:
                 rec.set_field_value(name, self._defaults_for_field(ftype))
+            # nombre -> tipo físico, armado una vez en vez de names.index() por columna
+            field_types = {n: t for (n, t, _) in phys_fields}
             for c, v in zip(plan.columns, plan.values):
-                idx = names.index(c)
-                _, ftype, _ = phys_fields[idx]
+                ftype = field_types.get(c)
+                if ftype is None:
+                    raise ValueError(f"Columna {c} no existe en la tabla {plan.table}")
                 vv = v
                 if c == "fecha" and isinstance(vv, str):
                     vv = self._cast_date_ddmmyyyy_to_iso(vv)
@@ -1,23 +1,27 @@
+from lark.exceptions import LarkError
+
 from .parser import parse
 from .executor import Executor
 
+def _run_plans(executor: Executor, plans):
+    # cada plan falla por separado: un error no corta el resto del script
+    results = []
+    for plan in plans:
+        try:
+            results.append(executor.execute(plan))
+        except Exception as e:
+            results.append(f"ERROR: {e}")
+    return results
+
 def execute_sql(db_manager, sql: str):
     try:
         plans = parse(sql)
-        if not plans:
-            return "ERROR: No se pudieron parsear consultas"
-
-        executor = Executor(db_manager)
-
-        results = []
-        for plan in plans:
-            try:
-                result = executor.execute(plan)
-                results.append(result)
-            except Exception as e:
-                results.append(f"ERROR: {e}")
-
-        return results[0] if len(results) == 1 else results
+    except (LarkError, ValueError, TypeError) as e:
+        # errores de sintaxis, de transformación (VisitError) y de armado del plan
+        # (literal o tipo de índice inválido) se reportan igual que antes: "ERROR: ..."
+        return f"ERROR: {e}"
+    if not plans:
+        return "ERROR: No se pudieron parsear consultas"
 
-    except Exception as e:
-        return f"ERROR: {e}"
\ No newline at end of file
+    results = _run_plans(Executor(db_manager), plans)
+    return results[0] if len(results) == 1 else results
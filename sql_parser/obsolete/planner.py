@@ -1,4 +1,5 @@
 #Esto es para el PLAN DE EJECUCIÓN
+import sys
 from typing import Optional, Dict
 from .plan_types import (
     SelectPlan, PredicateEq, PredicateBetween, ExplainPlan
@@ -9,63 +10,78 @@ class Catalog:
         self.tables = {}  # name -> dict(rows, pages, width, indexes={col: kind}, key='id')
     def register_table(self, name, rows, pages, width, indexes):
         # indexes: dict(col -> "ISAM"|"BTREE"|"HASH"|...)
+        # claves internadas, igual que los nombres de columna que produce el parser
         self.tables[name] = {
             "rows": rows, "pages": pages, "width": width,
-            "indexes": indexes
+            "indexes": {sys.intern(k): v for k, v in indexes.items()}
         }
     def get_indexes(self, table) -> Dict[str, str]:
         t = self.tables.get(table, {})
         return t.get("indexes", {})
 
+# tipo de nodo como entero: format_plan compara por veracidad en vez de por string
+SEQ_SCAN = 0
+INDEX_SCAN = 1
+
+# operadores y tipos de índice (se comparan con ==: index_kind puede venir del catálogo)
+EQ, BETWEEN = "==", "BETWEEN"
+ISAM, BTREE, HASH = "ISAM", "BTREE", "HASH"
+
 class PlanNode:
-    def __init__(self, kind: str, table: str, index_col: Optional[str]=None, index_kind: Optional[str]=None, op: Optional[str]=None):
-        self.kind = kind              # "IndexScan" | "SeqScan"
+    __slots__ = ("kind", "table", "index_col", "index_kind", "op")
+
+    def __init__(self, kind: int, table: str, index_col: Optional[str]=None, index_kind: Optional[str]=None, op: Optional[str]=None):
+        self.kind = kind              # SEQ_SCAN | INDEX_SCAN
         self.table = table
         self.index_col = index_col    # columna de índice
         self.index_kind = index_kind  # ISAM/BTREE/HASH
         self.op = op                  # "==", "BETWEEN"
 
+def _plan_eq(sel: SelectPlan, w: PredicateEq, idx: Dict[str, str]) -> PlanNode:
+    col = w.column
+    if col in idx:
+        kind = idx[col]
+        if kind == ISAM:
+            return PlanNode(INDEX_SCAN, sel.table, col, ISAM, op=EQ)
+        if kind == BTREE:
+            return PlanNode(INDEX_SCAN, sel.table, col, BTREE, op=EQ)
+        if kind == HASH:
+            # Hash solo para igualdad
+            return PlanNode(INDEX_SCAN, sel.table, col, HASH, op=EQ)
+    # si no hay índice para esa col:
+    return PlanNode(SEQ_SCAN, sel.table, op="equality")
+
+def _plan_between(sel: SelectPlan, w: PredicateBetween, idx: Dict[str, str]) -> PlanNode:
+    col = w.column
+    if col in idx and idx[col] == BTREE:
+        return PlanNode(INDEX_SCAN, sel.table, col, BTREE, op=BETWEEN)
+    # Hash no sirve para rango
+    return PlanNode(SEQ_SCAN, sel.table, op=BETWEEN)
+
+# tipo de predicado -> función que lo planifica (una búsqueda en dict en vez de isinstance encadenados)
+_PLAN_DISPATCH = {
+    PredicateEq: _plan_eq,
+    PredicateBetween: _plan_between,
+}
+
 def plan_select(sel: SelectPlan, cat: Catalog) -> PlanNode:
-    idx = cat.get_indexes(sel.table) if cat else {}
     # Sin WHERE => SeqScan
     if sel.where is None:
-        return PlanNode("SeqScan", table=sel.table, op=None)
-
-    w = sel.where
-
-    # Igualdad
-    if isinstance(w, PredicateEq):
-        col = w.column
-        if col in idx:
-            kind = idx[col]
-            if kind == "ISAM":
-                return PlanNode("IndexScan", sel.table, col, "ISAM", op="==")
-            if kind == "BTREE":
-                return PlanNode("IndexScan", sel.table, col, "BTREE", op="==")
-            if kind == "HASH":
-                # Hash solo para igualdad
-                return PlanNode("IndexScan", sel.table, col, "HASH", op="==")
-        # si no hay índice para esa col:
-        return PlanNode("SeqScan", sel.table, op="equality")
-
-    # BETWEEN
-    if isinstance(w, PredicateBetween):
-        col = w.column
-        if col in idx and idx[col] == "BTREE":
-            return PlanNode("IndexScan", sel.table, col, "BTREE", op="BETWEEN")
-        # Hash no sirve para rango
-        return PlanNode("SeqScan", sel.table, op="BETWEEN")
-    return PlanNode("SeqScan", sel.table, op="filter")
+        return PlanNode(SEQ_SCAN, table=sel.table, op=None)
+
+    fn = _PLAN_DISPATCH.get(type(sel.where))
+    if fn is None:
+        return PlanNode(SEQ_SCAN, sel.table, op="filter")
+    idx = cat.get_indexes(sel.table) if cat else {}
+    return fn(sel, sel.where, idx)
 
 def format_plan(p: PlanNode) -> str:
-    if p.kind == "SeqScan":
-        if p.op:
-            return f"Seq Scan\n  -> filter: {p.op}"
-        return "Seq Scan"
-    if p.kind == "IndexScan":
-        extra = " (equality only)" if p.index_kind == "HASH" and p.op == "==" else ""
+    if p.kind:
+        extra = " (equality only)" if p.index_kind == HASH and p.op == EQ else ""
         return f"Index Scan using {p.index_kind}{extra}\n  -> index_col={p.index_col}, op={p.op}"
-    return f"{p.kind}"
+    if p.op:
+        return f"Seq Scan\n  -> filter: {p.op}"
+    return "Seq Scan"
 
 def physical_explain(db_manager, sel_plan) -> str:
     table = sel_plan.table
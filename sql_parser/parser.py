@@ -1,3 +1,4 @@
+from ._grammar import GRAMMAR
 from .plan_types import (
     ColumnType, ColumnDef,
     CreateTablePlan, LoadDataPlan,
@@ -6,210 +7,221 @@ from .plan_types import (
     PredicateEq, PredicateBetween, PredicateInPointRadius, PredicateKNN,
 )
 
-from lark import Lark, Transformer, Token
-from typing import Any, List
+import hashlib
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from lark import Lark, Transformer, Token, v_args
 
-# Cargar gramática desde archivo grammar.lark
-with open(__file__.replace("parser.py", "grammar.lark"), "r", encoding="utf-8") as f:
-    _GRAMMAR = f.read()
 
-_PARSER = Lark(_GRAMMAR, start="start", parser="lalr")
+def _cache_path() -> str:
+    # Las tablas LALR se guardan en disco junto al módulo; el hash de la
+    # gramática en el nombre del archivo invalida el cache si grammar.lark cambia
+    digest = hashlib.md5(GRAMMAR.encode("utf-8")).hexdigest()
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f".grammar_{digest}.cache")
 
+def _build_parser() -> Lark:
+    return Lark(GRAMMAR, start="start", parser="lalr", cache=_cache_path())
 
-# helpers
-def _to_int_or_float(s: str) -> Any:
-    try:
-        if "." in s:
-            return float(s)
-        return int(s)
-    except ValueError:
-        return float(s)
 
+@lru_cache(maxsize=1)
+def _get_parser() -> Lark:
+    # se construye una sola vez por proceso y solo cuando se parsea algo
+    return _build_parser()
+
+
+# helpers
 def _tok2str(x) -> str:
     if isinstance(x, Token):
         return x.value
     return str(x)
 
 
+_VALID_INDEX_KINDS = frozenset(("SEQUENTIAL", "ISAM", "BTREE", "RTREE", "HASH"))
+
+
+@v_args(inline=True)
 class _T(Transformer):
+    # los hijos llegan como argumentos posicionales; las reglas de aridad
+    # variable usan @v_args(inline=False) y reciben la lista completa
+
     # ==== TIPOS ====
-    def t_int(self, _):      return ColumnType("INT")
-    def t_float(self, _):    return ColumnType("FLOAT")
-    def t_date(self, _):     return ColumnType("DATE")
-    def t_varchar(self, it): return ColumnType("VARCHAR", int(_tok2str(it[0])))
-    def t_array_2d(self, _): return ColumnType("ARRAY", 2)
-    def t_array_nd(self, it): return ColumnType("ARRAY", int(_tok2str(it[0])))
+    def t_int(self):         return ColumnType("INT")
+    def t_float(self):       return ColumnType("FLOAT")
+    def t_date(self):        return ColumnType("DATE")
+    def t_varchar(self, n):  return ColumnType("VARCHAR", int(n))
+    def t_array_2d(self):    return ColumnType("ARRAY", 2)
+    def t_array_nd(self, n): return ColumnType("ARRAY", int(n))
 
     # ==== LITERALES / BÁSICOS ====
-    def int_lit(self, items):
-        tok = items[0]
-        return int(tok.value if isinstance(tok, Token) else str(tok))
-
-    def float_lit(self, items):
-        tok = items[0]
-        return float(tok.value if isinstance(tok, Token) else str(tok))
-
-    def number(self, items):
-        tok = items[0]
-        s = tok.value if isinstance(tok, Token) else str(tok)
-        return _to_int_or_float(s)
-
-    def string(self, items):
-        s = items[0]
-        if isinstance(s, Token):
-            # para quitar comillas de ESCAPED_STRING
-            return s.value[1:-1]
-        return str(s)
-
-    def literal(self, items):
-        return items[0]
-
-    def null(self, _): return None
-    
+    def int_lit(self, tok):
+        return int(tok)
+
+    def float_lit(self, tok):
+        return float(tok)
+
+    def string(self, s):
+        # Token es str: se recortan las comillas de ESCAPED_STRING sin pasar por .value
+        return s[1:-1] if isinstance(s, Token) else str(s)
+
+    def literal(self, x):
+        return x
+
+    def null(self): return None
+
+    @v_args(inline=False)
     def spatial_point(self, items):
         return tuple(items)
-    
-    def array_lit(self, items):
-        return items[0]
 
-    def ident_or_string(self, items):
-        x = items[0]
+    def array_lit(self, pt):
+        return pt
+
+    def ident_or_string(self, x):
         if isinstance(x, Token):
-            if x.type == "IDENT":
-                return x.value
-            return x.value[1:-1]
+            return str(x) if x.type == "IDENT" else x[1:-1]
         return str(x)
 
     # ==== LISTAS ====
+    @v_args(inline=False)
     def col_list(self, items):
-        return [str(x) for x in items]
+        # nombres de columna internados: las búsquedas en dicts comparan por identidad
+        intern = sys.intern
+        return [intern(str(x)) for x in items]
 
     # ==== CREATE TABLE ====
+    @v_args(inline=False)
     def coldef(self, items):
-        name = _tok2str(items[0])
+        name = sys.intern(_tok2str(items[0]))
         coltype = items[1]
         is_key = False
         index = None
-        VALID = {"SEQUENTIAL", "ISAM", "BTREE", "RTREE", "HASH"}
-        for it in items[2:]:
+        tok2str = _tok2str
+        for i in range(2, len(items)):
+            it = items[i]
             if it == "KEY":
                 is_key = True
             elif it is None:
                 continue
             else:
-                s = _tok2str(it)
-                if s in VALID:
+                s = tok2str(it)
+                if s in _VALID_INDEX_KINDS:
                     index = s
         return ColumnDef(name=name, type=coltype, is_key=is_key, index=index)
 
-    def index_kind(self, items):  # INDEX_KIND -> str
-        return str(items[0])
+    def index_kind(self, kind):  # INDEX_KIND -> str
+        return str(kind)
 
+    @v_args(inline=False)
     def create_table(self, items):
         table = _tok2str(items[0])
-        columns = items[1:]
-        return CreateTablePlan(table=table, columns=columns)
+        return CreateTablePlan(table=table, columns=tuple(items[1:]))
 
     # ==== LOAD DATA FROM FILE ====
+    @v_args(inline=False)
     def load_data(self, items):
-        filepath = self.ident_or_string([items[0]])
+        filepath = self.ident_or_string(items[0])
         table = _tok2str(items[1])
         mappings = None
         if len(items) > 2:
-            mappings = {}
-            for mapping in items[2:]:
-                if mapping is None:
-                    continue
-                array_field = mapping[0]
-                csv_columns = mapping[1]
-                mappings[array_field] = csv_columns
+            # cada mapping ya es un par (campo_array, columnas_csv)
+            mappings = MappingProxyType(dict(m for m in items[2:] if m is not None))
         return LoadDataPlan(table=table, filepath=filepath, column_mappings=mappings)
-    
+
+    @v_args(inline=False)
     def column_mapping(self, items):
         array_field = _tok2str(items[0])
-        csv_columns = [_tok2str(item) for item in items[1:]]
+        csv_columns = tuple(_tok2str(item) for item in items[1:])
         return (array_field, csv_columns)
 
     # ==== SELECT ====
-    def select_all(self, _): return None
-    def select_cols(self, items):
+    @v_args(inline=False)
+    def select_list(self, items):
+        # "*" es un token anónimo filtrado: sin hijos => todas las columnas (None)
+        if not items:
+            return None
         cols = items[0]
-        return cols if isinstance(cols, list) else [str(cols)]
+        return tuple(cols) if isinstance(cols, list) else (str(cols),)
 
     # punto (x,y)
-    def point(self, items):
+    def point(self, *items):
         coords = [float(item) for item in items]
         return 
-    
-    def pred_eq(self, items):
-        return PredicateEq(column=str(items[0]), value=items[1])
-
-    def pred_between(self, items):
-        return PredicateBetween(column=str(items[0]), lo=items[1], hi=items[2])
-
-    def pred_in(self, items):
-        col = str(items[0])
-        pt = items[1]
-        radius = float(items[2])
-        return PredicateInPointRadius(column=col, point=pt, radius=radius)
-
-    def pred_nearest(self, items):
-        col = str(items[0])
-        pt = items[1]            # (x, y)
-        k = int(items[2])
-        return PredicateKNN(column=col, point=pt, k=k)
-
-    def select_stmt(self, items):
-        cols_or_none = items[0]
-        table = _tok2str(items[1])
-        where = items[2] if len(items) > 2 else None
-        return SelectPlan(table=table, columns=cols_or_none, where=where)
+
+    def pred_eq(self, col, value):
+        return PredicateEq(column=sys.intern(str(col)), value=value)
+
+    def pred_between(self, col, lo, hi):
+        return PredicateBetween(column=sys.intern(str(col)), lo=lo, hi=hi)
+
+    def pred_in(self, col, pt, radius):
+        return PredicateInPointRadius(column=sys.intern(str(col)), point=pt, radius=float(radius))
+
+    def pred_nearest(self, col, pt, k):
+        # pt = (x, y)
+        return PredicateKNN(column=sys.intern(str(col)), point=pt, k=int(k))
+
+    def select_stmt(self, cols_or_none, table, where=None):
+        return SelectPlan(table=_tok2str(table), columns=cols_or_none, where=where)
 
 
     # ==== INSERT ====
+    @v_args(inline=False)
     def insert_stmt(self, items):
         table = _tok2str(items[0])
         rest = [x for x in items[1:] if x is not None]
         if rest and isinstance(rest[0], list):   # con lista de columnas
-            cols = rest[0]
-            vals = rest[1:]
+            cols = tuple(rest[0])
+            vals = tuple(rest[1:])
         else:                                     # sin lista de columnas
             cols = None
-            vals = rest
+            vals = tuple(rest)
 
         return InsertPlan(table=table, columns=cols, values=vals)
 
 
     # ==== DELETE ====
-    def delete_stmt(self, items):
-        table = _tok2str(items[0])
-        where = items[1] if len(items) > 1 else None
-        return DeletePlan(table=table, where=where)
+    def delete_stmt(self, table, where=None):
+        return DeletePlan(table=_tok2str(table), where=where)
 
     # ==== CREATE INDEX ====
-    def create_index(self, items):
-        table = _tok2str(items[0])
-        column = _tok2str(items[1])
-        index_type = _tok2str(items[2])
-        return CreateIndexPlan(index_name=column, table=table, column=column, index_type=index_type)
+    def create_index(self, table, column, index_type):
+        column = _tok2str(column)
+        return CreateIndexPlan(index_name=column, table=_tok2str(table), column=column,
+                               index_type=_tok2str(index_type))
 
     # ==== DROP TABLE ====
-    def drop_table(self, items):
-        table = _tok2str(items[0])
-        return DropTablePlan(table=table)
+    def drop_table(self, table):
+        return DropTablePlan(table=_tok2str(table))
 
     # ==== DROP INDEX ====
-    def drop_index(self, items):
-        index_name = _tok2str(items[0])
-        return DropIndexPlan(index_name=index_name)
+    def drop_index(self, index_name):
+        return DropIndexPlan(index_name=_tok2str(index_name))
 
+    @v_args(inline=False)
     def start(self, items):
         return items
 
+# instancia única, reutilizada por todas las llamadas a parse()
 _TRANSFORMER = _T()
 
-def parse(sql: str):
-    sql = sql.strip().rstrip(";")
-    tree = _PARSER.parse(sql)
+@lru_cache(maxsize=512)
+def _parse_cached(sql: str) -> tuple:
+    # los planes se comparten entre llamadas: son dataclasses frozen y sus campos
+    # compuestos son tuplas o MappingProxyType, así que nadie puede modificarlos
+    tree = _get_parser().parse(sql)
     res = _TRANSFORMER.transform(tree)
-    return res if isinstance(res, list) else [res]
+    return tuple(res) if isinstance(res, list) else (res,)
+
+def parse(sql: str):
+    # la clave del cache es el SQL normalizado; cada llamada recibe su propia lista
+    return list(_parse_cached(sql.strip().rstrip(";")))
+
+def clear_parse_cache() -> None:
+    # vacía el cache de planes de parse()
+    _parse_cached.cache_clear()
+
+def warm_up() -> None:
+    # carga las tablas LALR y recorre un statement mínimo al arrancar, así la
+    # primera consulta real no paga la inicialización (no toca el cache de parse)
+    _TRANSFORMER.transform(_get_parser().parse("SELECT * FROM _warmup"))
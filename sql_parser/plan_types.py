@@ -1,14 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Any, Dict
+from typing import Optional, Tuple, Any, Mapping
 
 # Tipos/Columnas
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnType:
     kind: str                 # "INT" | "FLOAT" | "DATE" | "VARCHAR" | "ARRAY_FLOAT"
     length: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnDef:
     name: str
     type: ColumnType
@@ -17,68 +17,68 @@ class ColumnDef:
 
 # Planes
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateTablePlan:
     table: str
-    columns: List[ColumnDef]
+    columns: Tuple[ColumnDef, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoadDataPlan:
     table: str
     filepath: str
-    column_mappings: Optional[Dict[str, List[str]]] = None
+    column_mappings: Optional[Mapping[str, Tuple[str, ...]]] = None  # MappingProxyType (solo lectura)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PredicateEq:
     column: str
     value: Any
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PredicateBetween:
     column: str
     lo: Any
     hi: Any
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PredicateInPointRadius:
     column: str
     point: Tuple[float, ...]
     radius: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PredicateKNN:
     column: str
     point: Tuple[float, ...]
     k: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectPlan:
     table: str
-    columns: Optional[List[str]]
+    columns: Optional[Tuple[str, ...]]
     where: Optional[Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InsertPlan:
     table: str
-    columns: Optional[List[str]]
-    values: List[Any]
+    columns: Optional[Tuple[str, ...]]
+    values: Tuple[Any, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeletePlan:
     table: str
     where: Any
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateIndexPlan:
     index_name: str
     table: str
     column: str
     index_type: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DropTablePlan:
     table: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DropIndexPlan:
     index_name: str
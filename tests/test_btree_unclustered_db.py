@@ -30,7 +30,19 @@ def load_sales_from_csv(db_manager, table_name, csv_path, max_records=100):
     print(f"{'='*60}")
     
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f, delimiter=';')
+        # csv.reader + índices de cabecera: evita armar un dict por fila
+        reader = csv.reader(f, delimiter=';')
+        header = next(reader)
+        i_id = header.index('ID de la venta')
+        i_name = header.index('Nombre producto')
+        i_qty = header.index('Cantidad vendida')
+        i_price = header.index('Precio unitario')
+        i_date = header.index('Fecha de venta')
+        # esquema resuelto una vez: cada fila solo arma su Record por posición
+        table_def = db_manager.tables[table_name]["table"]
+        fields = table_def.all_fields
+        key_field = table_def.key_field
+        names = ('sale_id', 'product_name', 'quantity', 'unit_price', 'sale_date')
         count = 0
         
         for row in reader:
@@ -38,23 +50,14 @@ def load_sales_from_csv(db_manager, table_name, csv_path, max_records=100):
                 break
             
             try:
-                sale_id = int(row['ID de la venta'])
-                product_name = row['Nombre producto'].strip().encode('utf-8')
-                quantity = int(row['Cantidad vendida'])
-                unit_price = float(row['Precio unitario'].replace(',', '.'))
-                sale_date = row['Fecha de venta'].strip().encode('utf-8')
+                sale_id = int(row[i_id])
+                product_name = row[i_name].strip().encode('utf-8')
+                quantity = int(row[i_qty])
+                unit_price = float(row[i_price].replace(',', '.'))
+                sale_date = row[i_date].strip().encode('utf-8')
                 
-                table_info = db_manager.tables[table_name]
-                table_def = table_info["table"]
-                
-                record = Record(table_def.all_fields, table_def.key_field)
-                record.set_values(
-                    sale_id=sale_id,
-                    product_name=product_name,
-                    quantity=quantity,
-                    unit_price=unit_price,
-                    sale_date=sale_date
-                )
+                record = Record.from_fields(fields, key_field, names,
+                                            (sale_id, product_name, quantity, unit_price, sale_date))
                 
                 result = db_manager.insert(table_name, record)
                 count += 1
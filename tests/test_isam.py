@@ -8,6 +8,7 @@ os.chdir(os.path.join(os.path.dirname(__file__), '..'))
 from indexes.core.database_manager import DatabaseManager
 from sql_parser.parser import parse
 from sql_parser.executor import Executor
+from indexes.core.record import Record
 import shutil
 import time
 
@@ -17,7 +18,7 @@ def print_metrics(result, operation_name):
     print(f"  Reads: {result.disk_reads}")
     print(f"  Writes: {result.disk_writes}")
     print(f"  Total accesses: {result.total_disk_accesses}")
-    if hasattr(result, 'operation_breakdown') and result.operation_breakdown:
+    if result.operation_breakdown:
         print(f"  Breakdown: {result.operation_breakdown}")
 
 def test_isam():
@@ -108,6 +109,35 @@ def test_isam():
     print(f"   Total después de deletes: {len(result.data)} estudiantes")
     print_metrics(result, "SCAN ALL after DELETE")
 
+    print("\n9. BULK INSERT + SEARCH MANY (lote por DatabaseManager, registro a registro)")
+    table = db.tables["estudiantes"]["table"]
+    lote = []
+    for sid in range(200, 205):
+        record = Record(table.all_fields, table.key_field)
+        record.set_values(id=sid, nombre=f"Estudiante {sid}", edad=20, promedio=15.0)
+        lote.append(record)
+    result = db.bulk_insert("estudiantes", lote)
+    assert result.data == 5
+    print(f"   Insertados en lote: {result.data}")
+    print_metrics(result, "BULK INSERT")
+
+    # mismo comportamiento que el camino del sequential: clave existente => ValueError, nada insertado
+    record = Record(table.all_fields, table.key_field)
+    record.set_values(id=210, nombre="Estudiante 210", edad=21, promedio=16.0)
+    try:
+        db.bulk_insert("estudiantes", [record, lote[0]])
+        raise AssertionError("bulk_insert aceptó una clave repetida")
+    except ValueError as e:
+        print(f"   Lote con clave repetida rechazado: {e}")
+    assert not db.search("estudiantes", 210).data
+
+    keys = [202, 105, 204, 101]
+    result = db.search_many("estudiantes", keys)
+    found = [rec.id if rec else None for rec in result.data]
+    assert found == [202, None, 204, 101]
+    print(f"   Claves {keys} -> {found}")
+    print_metrics(result, "SEARCH MANY")
+
     print("\n" + "=" * 70)
     print("TEST ISAM PASSED")
     print("=" * 70)
@@ -7,7 +7,9 @@ os.chdir(os.path.join(os.path.dirname(__file__), '..'))
 
 from indexes.core.database_manager import DatabaseManager
 from sql_parser.parser import parse
-from sql_parser.executor import Executor
+from sql_parser import executor as executor_module
+from sql_parser.executor import Executor, _parse_csv_chunk
+from unittest import mock
 import shutil
 import time
 
@@ -17,7 +19,7 @@ def print_metrics(result, operation_name):
     print(f"  Reads: {result.disk_reads}")
     print(f"  Writes: {result.disk_writes}")
     print(f"  Total accesses: {result.total_disk_accesses}")
-    if hasattr(result, 'operation_breakdown') and result.operation_breakdown:
+    if result.operation_breakdown:
         print(f"  Breakdown: {result.operation_breakdown}")
 
 def test_load_data_csv():
@@ -67,11 +69,11 @@ def test_load_data_csv():
         print_metrics(result, "CREATE INDEX")
 
         print("\n4. LOAD DATA FROM FILE (20 registros)")
-        start = time.time()
+        start = time.perf_counter_ns()
         result = executor.execute(parse(f'LOAD DATA FROM FILE "{csv_path}" INTO ventas')[0])
-        end = time.time()
+        end = time.perf_counter_ns()
         print(f"   {result.data}")
-        print(f"   Tiempo total de carga: {(end - start) * 1000:.2f} ms")
+        print(f"   Tiempo total de carga: {(end - start) / 1e6:.2f} ms")
         print_metrics(result, "LOAD DATA")
 
         print("\n5. Verificar datos cargados (SCAN ALL)")
@@ -127,5 +129,91 @@ def test_load_data_csv():
             os.remove(csv_path)
             print(f"\nCSV de prueba eliminado")
 
+def test_csv_chunks_quoted_newlines():
+    print("\n" + "=" * 70)
+    print("TEST: CHUNKS DE CSV CON CAMPOS MULTILÍNEA ENTRE COMILLAS")
+    print("=" * 70)
+
+    csv_path = "data/test_multilinea.csv"
+    os.makedirs("data", exist_ok=True)
+    n_rows = 2000
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        f.write('id,nota\n')
+        for i in range(1, n_rows + 1):
+            if i % 7 == 0:
+                # salto de línea y comillas escapadas dentro del campo
+                f.write(f'{i},"linea 1\nlinea ""2""\n"\n')
+            else:
+                f.write(f'{i},nota {i}\n')
+
+    try:
+        executor = Executor(DatabaseManager())
+        field_plan = (("id", "INT", 4, 0), ("nota", "CHAR", 40, 1))
+        for n_chunks in (2, 4, 8, 16):
+            rows = []
+            for start, end in executor._csv_chunk_bounds(csv_path, n_chunks):
+                rows.extend(_parse_csv_chunk(csv_path, start, end, ",", field_plan))
+            assert len(rows) == n_rows, (n_chunks, len(rows))
+            assert [values[0] for values in rows] == list(range(1, n_rows + 1))
+            print(f"   {n_chunks} chunks: {len(rows)} filas")
+    finally:
+        if os.path.exists(csv_path):
+            os.remove(csv_path)
+
+def test_load_data_parallel_matches_sequential():
+    print("\n" + "=" * 70)
+    print("TEST: LOAD DATA PARALELO vs SECUENCIAL")
+    print("=" * 70)
+
+    if os.path.exists('data/database'):
+        try:
+            shutil.rmtree('data/database')
+        except:
+            pass
+        time.sleep(0.5)
+
+    csv_path = "data/test_paralelo.csv"
+    os.makedirs("data", exist_ok=True)
+    n_rows = 1000
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        f.write('id,nota,precio\n')
+        for i in range(1, n_rows + 1):
+            if i % 9 == 0:
+                f.write(f'{i},"nota\n""{i}""",{i * 1.5}\n')
+            else:
+                f.write(f'{i},nota {i},{i * 1.5}\n')
+
+    try:
+        executor = Executor(DatabaseManager())
+        for table in ("notas_seq", "notas_par"):
+            executor.execute(parse(f"""
+                CREATE TABLE {table} (
+                    id INT KEY INDEX SEQUENTIAL,
+                    nota VARCHAR[20],
+                    precio FLOAT
+                )
+            """)[0])
+
+        result = executor.execute(parse(f'LOAD DATA FROM FILE "{csv_path}" INTO notas_seq')[0])
+        print(f"   Secuencial: {result.data}")
+
+        # fuerza el camino paralelo (mmap + ProcessPoolExecutor) con un archivo pequeño
+        with mock.patch.object(executor_module, "_MMAP_MIN_BYTES", 0), \
+             mock.patch.object(executor_module.os, "cpu_count", return_value=4):
+            assert len(executor._csv_chunk_bounds(csv_path, 4)) > 1
+            result = executor.execute(parse(f'LOAD DATA FROM FILE "{csv_path}" INTO notas_par')[0])
+        print(f"   Paralelo: {result.data}")
+
+        rows_seq = executor.execute(parse('SELECT * FROM notas_seq')[0]).data
+        rows_par = executor.execute(parse('SELECT * FROM notas_par')[0]).data
+        assert len(rows_seq) == n_rows, len(rows_seq)
+        assert rows_par == rows_seq
+        print(f"   Filas iguales: {len(rows_par)}/{len(rows_seq)}")
+    finally:
+        if os.path.exists(csv_path):
+            os.remove(csv_path)
+
 if __name__ == "__main__":
     test_load_data_csv()
+    test_csv_chunks_quoted_newlines()
+    test_load_data_parallel_matches_sequential()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+from indexes.core.record import Record, IndexRecord, Table
+
+SCHEMAS = [
+    ([("id", "INT", 4), ("nombre", "CHAR", 20), ("precio", "FLOAT", 4), ("active", "BOOL", 1)], "id",
+     {"id": 7, "nombre": "Laptop Dell", "precio": 850.5, "active": True}),
+    ([("id", "INT", 4), ("coords", "ARRAY", 2), ("ciudad", "CHAR", 10)], "id",
+     {"id": 3, "coords": [-12.0, -77.0], "ciudad": b"Lima"}),
+    # nombres que no pueden ir en código generado: usa los métodos genéricos
+    ([("class", "INT", 4), ("from", "CHAR", 5)], "class",
+     {"class": 1, "from": "abc"}),
+]
+
+def _generic_pack(record):
+    return Record.pack(record)
+
+def test_record_roundtrip():
+    print("=" * 70)
+    print("TEST: RECORD PACK/UNPACK")
+    print("=" * 70)
+
+    for fields, key, values in SCHEMAS:
+        record = Record(fields, key)
+        record.set_values(**values)
+        data = record.pack()
+
+        assert len(data) == record.RECORD_SIZE
+        # el pack generado por esquema debe coincidir con el genérico
+        assert data == _generic_pack(record)
+
+        restored = Record.unpack(data, fields, key)
+        assert restored.pack() == data
+        assert restored.get_key() == record.get_key()
+        print(f"   {[n for n, _, _ in fields]}: {restored}")
+
+    index_record = IndexRecord("CHAR", 10)
+    index_record.set_index_data(b"IT", 42)
+    restored = IndexRecord.unpack(index_record.pack(), index_record.value_type_size, "index_value")
+    assert restored.primary_key == 42
+    assert restored.index_value.rstrip(b"\x00") == b"IT"
+    print(f"   IndexRecord: {restored}")
+
+def test_reserved_field_names():
+    print("\n" + "=" * 70)
+    print("TEST: NOMBRES DE CAMPO RESERVADOS")
+    print("=" * 70)
+
+    # los campos comparten namespace con los métodos de Record: se rechazan al crear el esquema
+    for name in ("pack", "unpack", "FORMAT", "from_fields", "key_field", "mi campo"):
+        try:
+            Record([("id", "INT", 4), (name, "INT", 4)], "id")
+        except ValueError as e:
+            print(f"   {name!r}: {e}")
+        else:
+            raise AssertionError(f"campo {name!r} aceptado")
+
+def test_pack_many():
+    print("\n" + "=" * 70)
+    print("TEST: TABLE.PACK_MANY / UNPACK_MANY")
+    print("=" * 70)
+
+    table = Table("productos", [("id", "INT", 4), ("nombre", "CHAR", 20)], "id", {"active": ("BOOL", 1)})
+    records = []
+    for i in range(5):
+        record = Record(table.all_fields, table.key_field)
+        record.set_values(id=i, nombre=f"producto {i}", active=True)
+        records.append(record)
+
+    buf = table.pack_many(records)
+    assert bytes(buf) == b"".join(r.pack() for r in records)
+
+    restored = table.unpack_many(buf)
+    assert [r.get_key() for r in restored] == list(range(5))
+    print(f"   {len(restored)} registros, {len(buf)} bytes")
+
+def benchmark_pack_unpack(number=1_000_000):
+    fields, key, values = SCHEMAS[0]
+    record = Record(fields, key)
+    record.set_values(**values)
+    data = record.pack()
+
+    pack_s = min(timeit.repeat(record.pack, number=number, repeat=3))
+    unpack_s = min(timeit.repeat(lambda: Record.unpack(data, fields, key), number=number, repeat=3))
+    print(f"\n   pack:   {pack_s / number * 1e9:.0f} ns/op")
+    print(f"   unpack: {unpack_s / number * 1e9:.0f} ns/op")
+
+if __name__ == "__main__":
+    test_record_roundtrip()
+    test_reserved_field_names()
+    test_pack_many()
+    # --bench: mide pack/unpack en un loop para detectar regresiones
+    if "--bench" in sys.argv:
+        benchmark_pack_unpack()
@@ -17,7 +17,7 @@ def print_metrics(result, operation_name):
     print(f"  Reads: {result.disk_reads}")
     print(f"  Writes: {result.disk_writes}")
     print(f"  Total accesses: {result.total_disk_accesses}")
-    if hasattr(result, 'operation_breakdown') and result.operation_breakdown:
+    if result.operation_breakdown:
         print(f"  Breakdown: {result.operation_breakdown}")
 
 def test_rtree_secondary():
@@ -8,6 +8,7 @@ os.chdir(os.path.join(os.path.dirname(__file__), '..'))
 from indexes.core.database_manager import DatabaseManager
 from sql_parser.parser import parse
 from sql_parser.executor import Executor
+from indexes.core.record import Record
 import shutil
 import time
 
@@ -17,7 +18,7 @@ def print_metrics(result, operation_name):
     print(f"  Reads: {result.disk_reads}")
     print(f"  Writes: {result.disk_writes}")
     print(f"  Total accesses: {result.total_disk_accesses}")
-    if hasattr(result, 'operation_breakdown') and result.operation_breakdown:
+    if result.operation_breakdown:
         print(f"  Breakdown: {result.operation_breakdown}")
 
 def test_sequential():
@@ -98,6 +99,35 @@ def test_sequential():
     print(f"   Total después de delete: {len(result.data)} productos")
     print_metrics(result, "SCAN ALL after DELETE")
 
+    print("\n8. BULK INSERT + SEARCH MANY (lote por DatabaseManager)")
+    table = db.tables["productos"]["table"]
+    lote = []
+    for pid in range(11, 16):
+        record = Record(table.all_fields, table.key_field)
+        record.set_values(id=pid, nombre=f"Producto {pid}", stock=pid, precio=float(pid))
+        lote.append(record)
+    result = db.bulk_insert("productos", lote)
+    assert result.data == 5
+    print(f"   Insertados en lote: {result.data}")
+    print_metrics(result, "BULK INSERT")
+
+    # una clave ya existente invalida todo el lote: no se inserta ningún registro
+    record = Record(table.all_fields, table.key_field)
+    record.set_values(id=20, nombre="Producto 20", stock=20, precio=20.0)
+    try:
+        db.bulk_insert("productos", [record, lote[0]])
+        raise AssertionError("bulk_insert aceptó una clave repetida")
+    except ValueError as e:
+        print(f"   Lote con clave repetida rechazado: {e}")
+    assert not db.search("productos", 20).data
+
+    keys = [12, 3, 15, 1]
+    result = db.search_many("productos", keys)
+    found = [rec.id if rec else None for rec in result.data]
+    assert found == [12, None, 15, 1]
+    print(f"   Claves {keys} -> {found}")
+    print_metrics(result, "SEARCH MANY")
+
     print("\n" + "=" * 70)
     print("TEST SEQUENTIAL PASSED")
     print("=" * 70)